@@ -2,192 +2,205 @@
 Script to add operation_id to all router endpoints for Bedrock compatibility (< 64 chars)
 """
 import re
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-# Define operation IDs for each router
+# Define (method, path, operation_id) entries for each router
 OPERATION_IDS = {
-    "users_router.py": {
-        "/users/create": "create_user",
-        "/users/{user_id}": "get_user",
-        "/users": "list_users",
-        "/users/{user_id}": "update_user",
-        "/users/{user_id}": "delete_user",
-    },
-    "roles_router.py": {
-        "/roles/create": "create_role",
-        "/roles/{role_id}": "get_role",
-        "/roles": "list_roles",
-        "/roles/{role_id}": "update_role",
-        "/roles/{role_id}": "delete_role",
-    },
-    "permissions_router.py": {
-        "/permissions/create": "create_permission",
-        "/permissions/{permission_id}": "get_permission",
-        "/permissions": "list_permissions",
-        "/permissions/{permission_id}": "update_permission",
-        "/permissions/{permission_id}": "delete_permission",
-    },
-    "user_roles_router.py": {
-        "/user-roles/assign": "assign_user_role",
-        "/user-roles/{user_role_id}": "get_user_role",
-        "/user-roles": "list_user_roles",
-        "/user-roles/user/{user_id}": "get_user_roles",
-        "/user-roles/{user_role_id}": "delete_user_role",
-    },
-    "role_permissions_router.py": {
-        "/role-permissions/assign": "assign_role_permission",
-        "/role-permissions/{role_permission_id}": "get_role_permission",
-        "/role-permissions": "list_role_permissions",
-        "/role-permissions/role/{role_id}": "get_role_permissions",
-        "/role-permissions/{role_permission_id}": "delete_role_permission",
-    },
-    "vendors_router.py": {
-        "/vendors/create": "create_vendor",
-        "/vendors/{vendor_id}": "get_vendor",
-        "/vendors": "list_vendors",
-        "/vendors/search/{vendor_code}": "search_vendor",
-        "/vendors/{vendor_id}": "update_vendor",
-        "/vendors/{vendor_id}": "delete_vendor",
-    },
-    "transactions_router.py": {
-        "/transactions/create": "create_transaction",
-        "/transactions/{transaction_id}": "get_transaction",
-        "/transactions": "list_transactions",
-        "/transactions/entity/{entity_id}": "get_entity_transactions",
-        "/transactions/{transaction_id}": "update_transaction",
-        "/transactions/{transaction_id}": "delete_transaction",
-    },
-    "items_router.py": {
-        "/items/create": "create_item",
-        "/items/{item_id}": "get_item",
-        "/items": "list_items",
-        "/items/search/{item_code}": "search_item",
-        "/items/{item_id}": "update_item",
-        "/items/{item_id}": "delete_item",
-    },
-    "expenses_router.py": {
-        "/expenses/categories/create": "create_expense_category",
-        "/expenses/categories/{category_id}": "get_expense_category",
-        "/expenses/categories": "list_expense_categories",
-        "/expenses/categories/{category_id}": "update_expense_category",
-        "/expenses/categories/{category_id}": "delete_expense_category",
-    },
-    "vendor_classification_router.py": {
-        "/vendor-classifications/create": "create_vendor_class",
-        "/vendor-classifications/{classification_id}": "get_vendor_class",
-        "/vendor-classifications": "list_vendor_classes",
-        "/vendor-classifications/{classification_id}": "update_vendor_class",
-        "/vendor-classifications/{classification_id}": "delete_vendor_class",
-    },
-    "workflows_router.py": {
-        "/workflows/create": "create_workflow",
-        "/workflows/{workflow_id}": "get_workflow",
-        "/workflows": "list_workflows",
-        "/workflows/client/{client_id}": "get_client_workflows",
-        "/workflows/{workflow_id}": "update_workflow",
-        "/workflows/{workflow_id}": "delete_workflow",
-    },
-    "logs_router.py": {
-        "/logs/create": "create_log",
-        "/logs/{log_id}": "get_log",
-        "/logs": "list_logs",
-        "/logs/entity/{entity_id}": "get_entity_logs",
-    },
-    "documents_router.py": {
-        "/documents/create": "create_document",
-        "/documents/{client_id}/{collection_name}/{document_id}": "get_document",
-        "/documents/{client_id}/{collection_name}": "list_documents",
-        "/documents/{client_id}/{collection_name}/{document_id}": "update_document",
-        "/documents/{client_id}/{collection_name}/{document_id}": "delete_document",
-    },
+    "users_router.py": [
+        ("post", "/users/create", "create_user"),
+        ("get", "/users/{user_id:uuid}", "get_user"),
+        ("get", "/users", "list_users"),
+        ("put", "/users/{user_id:uuid}", "update_user"),
+        ("delete", "/users/{user_id:uuid}", "delete_user"),
+    ],
+    "roles_router.py": [
+        ("post", "/roles/create", "create_role"),
+        ("get", "/roles/{role_id:uuid}", "get_role"),
+        ("get", "/roles", "list_roles"),
+        ("put", "/roles/{role_id:uuid}", "update_role"),
+        ("delete", "/roles/{role_id:uuid}", "delete_role"),
+    ],
+    "permissions_router.py": [
+        ("post", "/permissions/create", "create_permission"),
+        ("get", "/permissions/{permission_id:uuid}", "get_permission"),
+        ("get", "/permissions", "list_permissions"),
+        ("put", "/permissions/{permission_id:uuid}", "update_permission"),
+        ("delete", "/permissions/{permission_id:uuid}", "delete_permission"),
+    ],
+    "user_roles_router.py": [
+        ("post", "/user-roles/assign", "assign_user_role"),
+        ("get", "/user-roles/{user_role_id}", "get_user_role"),
+        ("get", "/user-roles", "list_user_roles"),
+        ("get", "/user-roles/user/{user_id}", "get_user_roles"),
+        ("delete", "/user-roles/{user_role_id}", "delete_user_role"),
+    ],
+    "role_permissions_router.py": [
+        ("post", "/role-permissions/assign", "assign_role_permission"),
+        ("get", "/role-permissions/{role_permission_id}", "get_role_permission"),
+        ("get", "/role-permissions", "list_role_permissions"),
+        ("get", "/role-permissions/role/{role_id}", "get_role_permissions"),
+        ("delete", "/role-permissions/{role_permission_id}", "delete_role_permission"),
+    ],
+    "vendors_router.py": [
+        ("post", "/vendors/create", "create_vendor"),
+        ("get", "/vendors/{vendor_id}", "get_vendor"),
+        ("get", "/vendors", "list_vendors"),
+        ("get", "/vendors/search/{vendor_code}", "search_vendor"),
+        ("put", "/vendors/{vendor_id}", "update_vendor"),
+        ("delete", "/vendors/{vendor_id}", "delete_vendor"),
+    ],
+    "transactions_router.py": [
+        ("post", "/transactions/create", "create_transaction"),
+        ("get", "/transactions/{transaction_id}", "get_transaction"),
+        ("get", "/transactions", "list_transactions"),
+        ("get", "/transactions/entity/{entity_id}", "get_entity_transactions"),
+        ("put", "/transactions/{transaction_id}", "update_transaction"),
+        ("delete", "/transactions/{transaction_id}", "delete_transaction"),
+    ],
+    "items_router.py": [
+        ("post", "/items/create", "create_item"),
+        ("get", "/items/{item_id:uuid}", "get_item"),
+        ("get", "/items", "list_items"),
+        ("get", "/items/search/{item_code}", "search_item"),
+        ("put", "/items/{item_id:uuid}", "update_item"),
+        ("delete", "/items/{item_id:uuid}", "delete_item"),
+    ],
+    "expenses_router.py": [
+        ("post", "/expenses/categories/create", "create_expense_category"),
+        ("get", "/expenses/categories/{category_id}", "get_expense_category"),
+        ("get", "/expenses/categories", "list_expense_categories"),
+        ("put", "/expenses/categories/{category_id}", "update_expense_category"),
+        ("delete", "/expenses/categories/{category_id}", "delete_expense_category"),
+    ],
+    "vendor_classification_router.py": [
+        ("post", "/vendor-classifications/create", "create_vendor_class"),
+        ("get", "/vendor-classifications/{classification_id}", "get_vendor_class"),
+        ("get", "/vendor-classifications", "list_vendor_classes"),
+        ("put", "/vendor-classifications/{classification_id}", "update_vendor_class"),
+        ("delete", "/vendor-classifications/{classification_id}", "delete_vendor_class"),
+    ],
+    "workflows_router.py": [
+        ("post", "/workflows/create", "create_workflow"),
+        ("get", "/workflows/{workflow_id}", "get_workflow"),
+        ("get", "/workflows", "list_workflows"),
+        ("get", "/workflows/client/{client_id}", "get_client_workflows"),
+        ("put", "/workflows/{workflow_id}", "update_workflow"),
+        ("delete", "/workflows/{workflow_id}", "delete_workflow"),
+    ],
+    "logs_router.py": [
+        ("post", "/logs/create", "create_log"),
+        ("get", "/logs/{log_id}", "get_log"),
+        ("get", "/logs", "list_logs"),
+        ("get", "/logs/entity/{entity_id}", "get_entity_logs"),
+    ],
+    "documents_router.py": [
+        ("post", "/documents/create", "create_document"),
+        ("get", "/documents/{client_id}/{collection_name}/{document_id}", "get_document"),
+        ("get", "/documents/{client_id}/{collection_name}", "list_documents"),
+        ("put", "/documents/{client_id}/{collection_name}/{document_id}", "update_document"),
+        ("delete", "/documents/{client_id}/{collection_name}/{document_id}", "delete_document"),
+    ],
 }
 
-def add_operation_id_to_decorator(content, method, path, operation_id):
-    """Add operation_id to a router decorator"""
-    # Pattern to match the decorator
-    pattern = rf'(@router\.{method}\(\s*"{re.escape(path)}",\s*response_model=APIResponse,)'
-    
-    # Check if operation_id already exists
-    if f'operation_id="{operation_id}"' in content:
-        return content
-    
-    # Add operation_id after response_model
-    replacement = rf'\1\n    operation_id="{operation_id}",'
-    
-    content = re.sub(pattern, replacement, content, count=1)
-    return content
+# Exact operation_id lookup per router file, keyed by (method, path)
+PATH_TO_OPERATION = {
+    file_name: {(method, path): operation_id for method, path, operation_id in entries}
+    for file_name, entries in OPERATION_IDS.items()
+}
+
+# Tokenizes router decorators up to their response_model argument (group 1,
+# with method in group 2 and path in group 3) and the `async def` lines that
+# close them (group 4), so one scan finds each decorator's full extent
+TOKEN_RE = re.compile(
+    r'(@router\.(post|get|put|patch|delete)\(\s*"([^"]+)"[^)]*?response_model=APIResponse,)'
+    r'|(async\s+def\s+\w+)'
+)
+
+def read_router_file(file_path):
+    """Read a router file, returning it alongside its path"""
+    return file_path, file_path.read_text(encoding='utf-8')
+
+def write_router_file(file_path, content):
+    """Write updated content back to a router file"""
+    file_path.write_text(content, encoding='utf-8')
 
-def process_router_file(file_path):
-    """Process a single router file"""
+def process_router_file(file_path, original):
+    """Process a single router file, returning the new content if it changed"""
     print(f"Processing {file_path.name}...")
     
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+    # Skip files where every decorator already carries an operation_id
+    if original.count('operation_id=') >= original.count('@router.'):
+        print(f"  - Already migrated {file_path.name}")
+        return None
     
-    # Simple mapping based on common patterns
-    operations = [
-        ("post", "/create", "create"),
-        ("get", "/{", "get"),
-        ("get", '",', "list"),
-        ("put", "/{", "update"),
-        ("patch", "/{", "patch"),
-        ("delete", "/{", "delete"),
-    ]
+    operations = PATH_TO_OPERATION.get(file_path.name, {})
+    unlisted = []
     
-    # Count modifications
-    modified = False
+    # Walk decorators and handler definitions in a single pass, splicing
+    # operation_id into decorators that lack one
+    pieces = []
+    last_end = 0
+    decorator = None
+    for match in TOKEN_RE.finditer(original):
+        if match.group(1):
+            decorator = match
+            continue
+        if decorator is None:
+            continue
+        if 'operation_id=' not in original[decorator.start():match.start()]:
+            method, path = decorator.group(2), decorator.group(3)
+            operation_id = operations.get((method, path))
+            if operation_id is None:
+                unlisted.append(f"{method.upper()} {path}")
+                operation_id = "TODO"
+            pieces.append(original[last_end:decorator.end()])
+            pieces.append(f'\n    operation_id="{operation_id}",')
+            last_end = decorator.end()
+        decorator = None
+    pieces.append(original[last_end:])
+    content = ''.join(pieces)
     
-    # Add operation_id where missing
-    lines = content.split('\n')
-    new_lines = []
-    i = 0
+    if unlisted:
+        print(f"  ! No operation_id listed for: {', '.join(unlisted)}")
     
-    while i < len(lines):
-        line = lines[i]
-        
-        # Check if this is a router decorator
-        if '@router.' in line and '(' in line:
-            # Check if next few lines have operation_id
-            has_operation_id = False
-            for j in range(i, min(i+10, len(lines))):
-                if 'operation_id=' in lines[j]:
-                    has_operation_id = True
-                    break
-                if 'async def' in lines[j]:
-                    break
-            
-            if not has_operation_id and 'response_model=APIResponse' in '\n'.join(lines[i:i+10]):
-                # Find the line with response_model
-                for j in range(i, min(i+10, len(lines))):
-                    if 'response_model=APIResponse' in lines[j]:
-                        new_lines.append(lines[i:j+1])
-                        # Add operation_id line
-                        indent = '    '
-                        new_lines.append(f'{indent}operation_id="TODO",')
-                        modified = True
-                        i = j + 1
-                        continue
-        
-        new_lines.append(line)
-        i += 1
-    
-    if modified:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(new_lines))
+    # Only hand back content when the transformation changed something
+    if content != original:
         print(f"  ✓ Modified {file_path.name}")
-    else:
-        print(f"  - No changes needed for {file_path.name}")
+        return content
+    
+    print(f"  - No changes needed for {file_path.name}")
+    return None
 
 def main():
     routes_dir = Path(__file__).parent / "api" / "routes"
     
-    router_files = list(routes_dir.glob("*_router.py"))
+    with os.scandir(routes_dir) as entries:
+        router_files = [
+            Path(entry.path) for entry in entries
+            if entry.is_file() and entry.name.endswith("_router.py")
+            and entry.name not in ["openapi_router.py", "routes.py"]
+        ]
     
     print(f"Found {len(router_files)} router files\n")
     
-    for router_file in router_files:
-        if router_file.name not in ["openapi_router.py", "routes.py"]:
-            process_router_file(router_file)
+    for file_name, entries in OPERATION_IDS.items():
+        routes = set((method, path) for method, path, _ in entries)
+        assert len(routes) == len(entries), f"Duplicate (method, path) entries for {file_name}"
+    
+    # File I/O goes through a thread pool so reads and writes overlap,
+    # while the regex work stays on the main thread
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        contents = list(pool.map(read_router_file, router_files))
+        
+        updates = []
+        for file_path, original in contents:
+            content = process_router_file(file_path, original)
+            if content is not None:
+                updates.append((file_path, content))
+        
+        list(pool.map(lambda update: write_router_file(*update), updates))
     
     print("\n✓ Done! Please review and update TODO operation_ids manually.")
 
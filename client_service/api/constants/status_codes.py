@@ -8,6 +8,7 @@ class StatusCode(IntEnum):
     SUCCESS = 200
     CREATED = 201
     NO_CONTENT = 204
+    NOT_MODIFIED = 304
     
     # Client error codes
     BAD_REQUEST = 400
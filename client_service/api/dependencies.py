@@ -1,5 +1,13 @@
+import hashlib
+import json
+from typing import Annotated, Any, Callable, Optional
+from uuid import UUID
+
+from fastapi import Depends, Path, Query, Request, Response
+from fastapi.encoders import jsonable_encoder
 from sqlalchemy.ext.asyncio import AsyncSession
-from client_service.db.postgres_db import get_db
+from client_service.api.constants.status_codes import StatusCode
+from client_service.db.postgres_db import get_db, get_read_db
 
 
 async def get_database_session() -> AsyncSession:
@@ -8,4 +16,62 @@ async def get_database_session() -> AsyncSession:
     Acts as a wrapper around get_db for use in route handlers.
     """
     async for session in get_db():
-        yield session
\ No newline at end of file
+        yield session
+
+
+async def get_read_session(request: Request) -> AsyncSession:
+    """
+    Dependency for read-only handlers.
+    Uses the read replica when one is configured; clients that must see
+    their own recent writes send `X-Read-Your-Writes: true` to read from the primary.
+    Handlers that populate response_cache use get_database_session instead, since
+    a replica read right after a write would be cached for the whole TTL.
+    """
+    if request.headers.get("x-read-your-writes", "").lower() == "true":
+        async for session in get_db():
+            yield session
+    else:
+        async for session in get_read_db():
+            yield session
+
+
+# Shared annotation so handlers declare the session dependency once
+DBSession = Annotated[AsyncSession, Depends(get_database_session)]
+
+# Shared parameter annotations reused across router handlers
+ClientIdParam = Annotated[UUID, Path(description="UUID of the client")]
+PaginationSkip = Annotated[int, Query(ge=0, description="Number of records to skip")]
+PaginationLimit = Annotated[int, Query(ge=1, le=100, description="Maximum number of records to return")]
+PaginationCursor = Annotated[Optional[UUID], Query(description="Return records after this ID (keyset pagination)")]
+
+
+def compute_etag(payload: Any) -> str:
+    """Build a weak ETag from the JSON form of a response payload"""
+    body = json.dumps(jsonable_encoder(payload), sort_keys=True, default=str)
+    return f'W/"{hashlib.blake2b(body.encode(), digest_size=16).hexdigest()}"'
+
+
+def etag_dep(request: Request, response: Response) -> Callable[[Any], Any]:
+    """
+    Dependency for conditional GETs.
+    Returns a callable that tags the payload with an ETag, or answers
+    304 Not Modified when the client's If-None-Match already matches.
+    HEAD requests get the ETag headers without serializing a body.
+    """
+    def apply(payload: Any) -> Any:
+        etag = compute_etag(payload)
+        if etag in request.headers.get("if-none-match", ""):
+            return Response(status_code=StatusCode.NOT_MODIFIED, headers={"ETag": etag})
+        if request.method == "HEAD":
+            return Response(
+                status_code=StatusCode.SUCCESS,
+                headers={"ETag": etag, "Cache-Control": "no-cache"},
+            )
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = "no-cache"
+        return payload
+
+    return apply
+
+
+ETag = Annotated[Callable[[Any], Any], Depends(etag_dep)]
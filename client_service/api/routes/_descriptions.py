@@ -0,0 +1,44 @@
+"""
+Route descriptions for the OpenAPI schema, keyed by operation_id.
+Kept out of the router modules so route tables stay compact.
+"""
+
+from typing import Dict
+
+DESCRIPTIONS: Dict[str, str] = {
+    # ==================== CLIENT SCHEMAS ====================
+    "create_schema": "Creates a new client-specific schema definition for dynamic documents (e.g., invoices, purchase orders, GRNs). Supports field validation, versioning, and references. Required: client_id (UUID string), schema_name (string), fields (array of {name, type, required}). Example: POST /client-schemas/create with body: {\"client_id\": \"uuid-here\", \"schema_name\": \"invoice\", \"fields\": [{\"name\": \"invoice_number\", \"type\": \"string\", \"required\": true}]}.",
+    "bulk_create_schemas": "Creates several client-specific schema definitions in one request. Body is an array of schema definitions, each with client_id (UUID string), schema_name (string) and fields (array of {name, type, required}). All schemas are validated before any is saved.",
+    "get_schema": "Retrieves a specific schema definition by its MongoDB ObjectId. Returns complete schema including all field definitions, validation rules, version info, and metadata. Call: GET /client-schemas/{schema_id} where schema_id is a MongoDB ObjectId string (24 hex chars).",
+    "list_schemas": "Lists all schema definitions across all clients with pagination. Returns schema_name, version, is_active status, client_id, and field count for each schema. Call: GET /client-schemas?skip=0&limit=100. Default: skip=0, limit=100.",
+    "get_client_schemas": "Retrieves all schema definitions (all versions) for a specific client by client_id. Returns complete schema details including fields, versions, and active status. Call: GET /client-schemas/client/{client_id} where client_id is a UUID string.",
+    "get_schema_by_name": "Retrieves all versions of a specific schema by client_id and schema_name (e.g., 'invoice', 'purchase_order'). Returns version history with field definitions. Call: GET /client-schemas/client/{client_id}/{schema_name} where both are strings.",
+    "get_active_schema": "Retrieves the currently active version of a schema by client_id and schema_name. Only one version can be active at a time. Call: GET /client-schemas/client/{client_id}/{schema_name}/active. Returns the active schema for validation.",
+    "update_schema": "Updates an existing schema definition by schema_id. Can modify description, field definitions, or validation rules. Call: PUT /client-schemas/{schema_id} with body containing fields to update: {\"description\": \"...\", \"fields\": [...]}. Updates in place - use caution on active schemas.",
+    "activate_schema": "Activates a specific schema version by schema_id, automatically deactivating all other versions of the same schema. Call: PATCH /client-schemas/{schema_id}/activate (no body required). The activated version becomes the default for document validation.",
+    "delete_schema": "Permanently deletes a schema definition by schema_id. WARNING: Cannot be undone. Call: DELETE /client-schemas/{schema_id} (no body required). Existing documents unaffected, but new documents cannot use this schema.",
+
+    # ==================== CLIENTS ====================
+    "create_client": "Creates a new client organization in the system. A client represents a company/organization that can have multiple entities (branches), users, and documents. Required fields: client_name. Optional: api_key for external integrations. Returns created client with UUID.",
+    "bulk_create_clients": "Creates several client organizations in one request. Body is an array of clients, each requiring client_name and optionally api_key. Names must be unique within the batch and the system; all clients are saved together or none are.",
+    "get_client": "Retrieves complete client organization details by client_id (UUID). Returns client_name, api_key, creation timestamp, and associated metadata. Use this to verify client exists or get client information.",
+    "list_clients": "Lists all client organizations in the system with pagination. Returns array of clients with id, name, api_key, and timestamps. Supports skip/limit parameters (max 100 per request). Useful for admin dashboards or client selection.",
+    "update_client": "Updates client organization details by client_id. Can modify client_name or regenerate api_key. Partial updates supported - only provided fields are changed. Returns updated client object.",
+    "delete_client": "Permanently deletes a client organization by client_id. WARNING: This cascades to delete ALL related data including entities, users, roles, documents, and schemas. Cannot be undone. Use with extreme caution.",
+
+    # ==================== DYNAMIC DOCUMENTS ====================
+    "create_document": 'Creates a new dynamic document (invoice, purchase order, GRN, etc.) in a MongoDB collection validated against the active schema. Call: POST /documents/create with body: {"client_id": "uuid", "collection_name": "invoice", "data": {"invoice_number": "INV-001", ...}, "created_by": "user-uuid"}. Validates against active schema.',
+    "bulk_create_documents": 'Creates documents for several create requests in one call. Body is an array of create requests: [{"client_id": "uuid", "collection_name": "invoice", "data": [{...}], "created_by": "user-uuid"}, ...]. Requests for the same client and collection are validated against the active schema and inserted together.',
+    "search_documents": (
+        "Search documents in a dynamic collection by specific field and value. Returns all matching documents.\n\n"
+        "Query params:\n"
+        "- column: name of a field defined in the collection schema, or one of the base fields [client_id, created_by, updated_by]\n"
+        "- value: text to match (case-insensitive, partial matches allowed)\n\n"
+        "Example: GET /documents/{client_id}/{collection_name}/search?column=invoice_number&value=INV-001"
+    ),
+    "get_document": "Retrieves a specific document by its MongoDB ObjectId from a client's collection. Returns complete document data including all fields and metadata. Call: GET /documents/{client_id}/{collection_name}/{document_id} where all are strings (document_id is 24-char ObjectId).",
+    "document_exists": "Checks whether a document exists by document_id without returning its data. Call: HEAD /documents/{client_id}/{collection_name}/{document_id}. Responds 200 with an empty body if found, 404 otherwise.",
+    "list_documents": "Lists all documents in a specific collection for a client with pagination. Returns array of documents with all fields and metadata. Call: GET /documents/{client_id}/{collection_name}?skip=0&limit=100. Default: skip=0, limit=100 (max).",
+    "update_document": 'Updates specific fields in an existing document by document_id. Validates updates against active schema. Call: PUT /documents/{client_id}/{collection_name}/{document_id} with body: {"data": {"status": "approved"}, "updated_by": "user-uuid"}. Partial update supported.',
+    "delete_document": "Permanently deletes a document from a collection by document_id. WARNING: Cannot be undone. Call: DELETE /documents/{client_id}/{collection_name}/{document_id} (no body). Document completely removed from MongoDB. Consider soft delete for audit trails.",
+}
@@ -1,7 +1,13 @@
 from fastapi import APIRouter, Depends, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from client_service.services.central_client_service import CentralClientService
-from client_service.api.dependencies import get_database_session
+from client_service.api.dependencies import (
+    PaginationCursor,
+    PaginationLimit,
+    PaginationSkip,
+    get_database_session,
+)
 from client_service.schemas.base_response import APIResponse
 from client_service.schemas.pydantic_schemas import (
     CentralClientCreate, 
@@ -10,7 +16,7 @@ from client_service.schemas.pydantic_schemas import (
 from uuid import UUID
 from typing import List
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
 @router.post(
@@ -52,12 +58,13 @@ async def get_central_client(
     description="Get all central clients with pagination. Use when: 'list central clients', 'show all parent clients'.",
 )
 async def get_all_central_clients(
-    skip: int = 0,
-    limit: int = 100,
+    skip: PaginationSkip = 0,
+    limit: PaginationLimit = 100,
+    after: PaginationCursor = None,
     db: AsyncSession = Depends(get_database_session)
 ):
     """Get all central clients with pagination"""
-    return await CentralClientService.get_all(skip, limit, db)
+    return await CentralClientService.get_all(skip, limit, db, after)
 
 
 @router.put(
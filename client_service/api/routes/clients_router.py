@@ -1,91 +1,144 @@
-from fastapi import APIRouter, Depends, status
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, status
+from fastapi.responses import ORJSONResponse
+from client_service.api.routes._descriptions import DESCRIPTIONS
 from client_service.services.clients_service import ClientService
-from client_service.api.dependencies import get_database_session
+from client_service.api.dependencies import (
+    ClientIdParam,
+    DBSession,
+    ETag,
+    PaginationLimit,
+    PaginationSkip,
+)
 from client_service.schemas.base_response import APIResponse
 from client_service.schemas.pydantic_schemas import (
     ClientCreate,
     ClientUpdate
 )
-from uuid import UUID
 from typing import List
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
-@router.post(
-    "/clients/create",
-    response_model=APIResponse,
-    status_code=status.HTTP_201_CREATED,
-    operation_id="create_client",
-    summary="Create a new client",
-    description="Creates a new client organization in the system. A client represents a company/organization that can have multiple entities (branches), users, and documents. Required fields: client_name. Optional: api_key for external integrations. Returns created client with UUID.",
-)
 async def create_client(
-    client_data: List[ClientCreate],
-    db: AsyncSession = Depends(get_database_session)
+    client_data: ClientCreate,
+    db: DBSession
 ):
     """Create a new client"""
+    return await ClientService.create([client_data], db)
+
+
+async def bulk_create_clients(
+    client_data: List[ClientCreate],
+    db: DBSession
+):
+    """Create several clients in one request"""
     return await ClientService.create(client_data, db)
 
 
-@router.get(
-    "/clients/{client_id}",
-    response_model=APIResponse,
-    operation_id="get_client",
-    summary="Get client by ID",
-    description="Retrieves complete client organization details by client_id (UUID). Returns client_name, api_key, creation timestamp, and associated metadata. Use this to verify client exists or get client information.",
-)
 async def get_client(
-    client_id: UUID,
-    db: AsyncSession = Depends(get_database_session)
+    client_id: ClientIdParam,
+    db: DBSession,
+    etag: ETag
 ):
     """Get a client by ID"""
-    return await ClientService.get_by_id(client_id, db)
+    return etag(await ClientService.get_by_id(client_id, db))
 
 
-@router.get(
-    "/clients",
-    response_model=APIResponse,
-    operation_id="list_clients",
-    summary="List all clients",
-    description="Lists all client organizations in the system with pagination. Returns array of clients with id, name, api_key, and timestamps. Supports skip/limit parameters (max 100 per request). Useful for admin dashboards or client selection.",
-)
 async def get_all_clients(
-    skip: int = 0,
-    limit: int = 100,
-    db: AsyncSession = Depends(get_database_session)
+    db: DBSession,
+    etag: ETag,
+    skip: PaginationSkip = 0,
+    limit: PaginationLimit = 100
 ):
     """Get all clients with pagination"""
-    return await ClientService.get_all(skip, limit, db)
+    return etag(await ClientService.get_all(skip, limit, db))
 
 
-@router.put(
-    "/clients/{client_id}",
-    response_model=APIResponse,
-    operation_id="update_client",
-    summary="Update client information",
-    description="Updates client organization details by client_id. Can modify client_name or regenerate api_key. Partial updates supported - only provided fields are changed. Returns updated client object.",
-)
 async def update_client(
-    client_id: UUID,
+    client_id: ClientIdParam,
     client_data: ClientUpdate,
-    db: AsyncSession = Depends(get_database_session)
+    db: DBSession
 ):
     """Update a client"""
     return await ClientService.update(client_id, client_data, db)
 
 
-@router.delete(
-    "/clients/{client_id}",
-    response_model=APIResponse,
-    operation_id="delete_client",
-    summary="Delete client",
-    description="Permanently deletes a client organization by client_id. WARNING: This cascades to delete ALL related data including entities, users, roles, documents, and schemas. Cannot be undone. Use with extreme caution.",
-)
 async def delete_client(
-    client_id: UUID,
-    db: AsyncSession = Depends(get_database_session)
+    client_id: ClientIdParam,
+    db: DBSession
 ):
     """Delete a client"""
-    return await ClientService.delete(client_id, db)
\ No newline at end of file
+    return await ClientService.delete(client_id, db)
+
+
+# (method, path, handler, route options) - registered in order below
+ROUTES = [
+    (
+        "POST",
+        "/clients/create",
+        create_client,
+        {
+            "status_code": status.HTTP_201_CREATED,
+            "operation_id": "create_client",
+            "summary": "Create a new client",
+            "description": DESCRIPTIONS["create_client"],
+        },
+    ),
+    (
+        "POST",
+        "/clients/bulk-create",
+        bulk_create_clients,
+        {
+            "status_code": status.HTTP_201_CREATED,
+            "operation_id": "bulk_create_clients",
+            "summary": "Create clients in bulk",
+            "description": DESCRIPTIONS["bulk_create_clients"],
+            "include_in_schema": False,
+        },
+    ),
+    (
+        "GET",
+        "/clients/{client_id}",
+        get_client,
+        {
+            "operation_id": "get_client",
+            "summary": "Get client by ID",
+            "description": DESCRIPTIONS["get_client"],
+        },
+    ),
+    (
+        "GET",
+        "/clients",
+        get_all_clients,
+        {
+            "operation_id": "list_clients",
+            "summary": "List all clients",
+            "description": DESCRIPTIONS["list_clients"],
+        },
+    ),
+    (
+        "PUT",
+        "/clients/{client_id}",
+        update_client,
+        {
+            "operation_id": "update_client",
+            "summary": "Update client information",
+            "description": DESCRIPTIONS["update_client"],
+        },
+    ),
+    (
+        "DELETE",
+        "/clients/{client_id}",
+        delete_client,
+        {
+            "operation_id": "delete_client",
+            "summary": "Delete client",
+            "description": DESCRIPTIONS["delete_client"],
+        },
+    ),
+]
+
+for method, path, handler, options in ROUTES:
+    router.add_api_route(
+        path, handler, methods=[method], response_model=APIResponse, **options
+    )
\ No newline at end of file
@@ -1,29 +1,29 @@
 import uuid
 from typing import List
 
-from client_service.api.dependencies import get_database_session
+from client_service.api.dependencies import (
+    ClientIdParam,
+    DBSession,
+    ETag,
+    PaginationLimit,
+    PaginationSkip,
+)
 from client_service.db.mongo_db import get_db
 from client_service.schemas.base_response import APIResponse
 from client_service.schemas.client_db.vendor_models import VendorMaster
 from client_service.schemas.pydantic_schemas import DocumentCreate, DocumentUpdate
 from client_service.services.document_service import DocumentService
-from fastapi import APIRouter, Depends, status
+from client_service.api.constants.status_codes import StatusCode
+from fastapi import APIRouter, Response, status
+from fastapi.responses import ORJSONResponse
+from client_service.api.routes._descriptions import DESCRIPTIONS
 from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
-@router.post(
-    "/documents/create",
-    response_model=APIResponse,
-    status_code=status.HTTP_201_CREATED,
-    operation_id="create_document",
-    summary="Create a document in dynamic collection",
-    description='Creates a new dynamic document (invoice, purchase order, GRN, etc.) in a MongoDB collection validated against the active schema. Call: POST /documents/create with body: {"client_id": "uuid", "collection_name": "invoice", "data": {"invoice_number": "INV-001", ...}, "created_by": "user-uuid"}. Validates against active schema.',
-)
 async def create_document(
-    document_data: DocumentCreate, db: AsyncSession = Depends(get_database_session)
+    document_data: DocumentCreate, db: DBSession
 ):
     """
     Create a new document in a dynamic collection.
@@ -45,25 +45,29 @@ async def create_document(
         created_by=document_data.created_by,
     )
 
-@router.get(
-    "/documents/{client_id}/{collection_name}/search",
-    response_model=APIResponse,
-    operation_id="search_documents",
-    summary="Search documents by field",
-    description=(
-        "Search documents in a dynamic collection by specific field and value. Returns all matching documents.\n\n"
-        "Query params:\n"
-        "- column: name of a field defined in the collection schema, or one of the base fields [client_id, created_by, updated_by]\n"
-        "- value: text to match (case-insensitive, partial matches allowed)\n\n"
-        "Example: GET /documents/{client_id}/{collection_name}/search?column=invoice_number&value=INV-001"
-    ),
-)
+async def bulk_create_documents(
+    documents_data: List[DocumentCreate], db: DBSession
+):
+    """
+    Create documents from several create requests in one call.
+
+    Requests targeting the same client and collection share one schema
+    lookup and one MongoDB insert_many. A single request falls back to
+    the regular create path.
+
+    Returns:
+        APIResponse with created document details
+    """
+    if len(documents_data) == 1:
+        return await create_document(documents_data[0], db)
+    return await DocumentService.bulk_create(documents_data, db)
+
 async def search_documents(
-    client_id: str,
+    client_id: ClientIdParam,
     collection_name: str,
     column: str,
     value: str,
-    db: AsyncSession = Depends(get_database_session),
+    db: DBSession,
 ):
     """
     Search documents by specific field in a dynamic collection.
@@ -86,18 +90,12 @@ async def search_documents(
         db=db,
     )
 
-@router.get(
-    "/documents/{client_id}/{collection_name}/{document_id}",
-    response_model=APIResponse,
-    operation_id="get_document",
-    summary="Get document by ID",
-    description="Retrieves a specific document by its MongoDB ObjectId from a client's collection. Returns complete document data including all fields and metadata. Call: GET /documents/{client_id}/{collection_name}/{document_id} where all are strings (document_id is 24-char ObjectId).",
-)
 async def get_document(
-    client_id: str,
+    client_id: ClientIdParam,
     collection_name: str,
     document_id: str,
-    db: AsyncSession = Depends(get_database_session),
+    db: DBSession,
+    etag: ETag,
 ):
     """
     Get a document by its MongoDB ObjectId.
@@ -110,27 +108,42 @@ async def get_document(
     Returns:
         APIResponse with document data
     """
-    return await DocumentService.get_by_id(
+    return etag(await DocumentService.get_by_id(
         client_id=client_id,
         collection_name=collection_name,
         document_id=document_id,
         db=db,
+    ))
+
+
+async def document_exists(
+    client_id: ClientIdParam,
+    collection_name: str,
+    document_id: str,
+):
+    """
+    Check whether a document exists without returning its body.
+
+    Returns:
+        Empty response with 200 if the document exists, 404 otherwise
+    """
+    exists = await DocumentService.exists(
+        client_id=client_id,
+        collection_name=collection_name,
+        document_id=document_id,
+    )
+    return Response(
+        status_code=StatusCode.SUCCESS if exists else StatusCode.NOT_FOUND
     )
 
 
-@router.get(
-    "/documents/{client_id}/{collection_name}",
-    response_model=APIResponse,
-    operation_id="list_documents",
-    summary="List all documents in collection",
-    description="Lists all documents in a specific collection for a client with pagination. Returns array of documents with all fields and metadata. Call: GET /documents/{client_id}/{collection_name}?skip=0&limit=100. Default: skip=0, limit=100 (max).",
-)
 async def get_all_documents(
-    client_id: str,
+    client_id: ClientIdParam,
     collection_name: str,
-    skip: int = 0,
-    limit: int = 100,
-    db: AsyncSession = Depends(get_database_session),
+    db: DBSession,
+    etag: ETag,
+    skip: PaginationSkip = 0,
+    limit: PaginationLimit = 100,
 ):
     """
     Get all documents in a collection for a specific client.
@@ -144,28 +157,21 @@ async def get_all_documents(
     Returns:
         APIResponse with list of documents
     """
-    return await DocumentService.get_all(
+    return etag(await DocumentService.get_all(
         client_id=client_id,
         collection_name=collection_name,
         db=db,
         skip=skip,
         limit=limit,
-    )
+    ))
 
 
-@router.put(
-    "/documents/{client_id}/{collection_name}/{document_id}",
-    response_model=APIResponse,
-    operation_id="update_document",
-    summary="Update document",
-    description='Updates specific fields in an existing document by document_id. Validates updates against active schema. Call: PUT /documents/{client_id}/{collection_name}/{document_id} with body: {"data": {"status": "approved"}, "updated_by": "user-uuid"}. Partial update supported.',
-)
 async def update_document(
-    client_id: str,
+    client_id: ClientIdParam,
     collection_name: str,
     document_id: str,
     update_data: DocumentUpdate,
-    db: AsyncSession = Depends(get_database_session),
+    db: DBSession,
 ):
     """
     Update a document in a dynamic collection.
@@ -195,18 +201,11 @@ async def update_document(
     )
 
 
-@router.delete(
-    "/documents/{client_id}/{collection_name}/{document_id}",
-    response_model=APIResponse,
-    operation_id="delete_document",
-    summary="Delete document",
-    description="Permanently deletes a document from a collection by document_id. WARNING: Cannot be undone. Call: DELETE /documents/{client_id}/{collection_name}/{document_id} (no body). Document completely removed from MongoDB. Consider soft delete for audit trails.",
-)
 async def delete_document(
-    client_id: str,
+    client_id: ClientIdParam,
     collection_name: str,
     document_id: str,
-    db: AsyncSession = Depends(get_database_session),
+    db: DBSession,
 ):
     """
     Delete a document from a dynamic collection.
@@ -225,3 +224,96 @@ async def delete_document(
         document_id=document_id,
         db=db,
     )
+
+
+# (method, path, handler, route options) - registered in order below
+ROUTES = [
+    (
+        "POST",
+        "/documents/create",
+        create_document,
+        {
+            "status_code": status.HTTP_201_CREATED,
+            "operation_id": "create_document",
+            "summary": "Create a document in dynamic collection",
+            "description": DESCRIPTIONS["create_document"],
+        },
+    ),
+    (
+        "POST",
+        "/documents/bulk-create",
+        bulk_create_documents,
+        {
+            "status_code": status.HTTP_201_CREATED,
+            "operation_id": "bulk_create_documents",
+            "summary": "Create documents in bulk",
+            "description": DESCRIPTIONS["bulk_create_documents"],
+            "include_in_schema": False,
+        },
+    ),
+    (
+        "GET",
+        "/documents/{client_id}/{collection_name}/search",
+        search_documents,
+        {
+            "operation_id": "search_documents",
+            "summary": "Search documents by field",
+            "description": DESCRIPTIONS["search_documents"],
+        },
+    ),
+    (
+        "GET",
+        "/documents/{client_id}/{collection_name}/{document_id}",
+        get_document,
+        {
+            "operation_id": "get_document",
+            "summary": "Get document by ID",
+            "description": DESCRIPTIONS["get_document"],
+        },
+    ),
+    (
+        "HEAD",
+        "/documents/{client_id}/{collection_name}/{document_id}",
+        document_exists,
+        {
+            "operation_id": "document_exists",
+            "summary": "Check document exists",
+            "description": DESCRIPTIONS["document_exists"],
+        },
+    ),
+    (
+        "GET",
+        "/documents/{client_id}/{collection_name}",
+        get_all_documents,
+        {
+            "operation_id": "list_documents",
+            "summary": "List all documents in collection",
+            "description": DESCRIPTIONS["list_documents"],
+        },
+    ),
+    (
+        "PUT",
+        "/documents/{client_id}/{collection_name}/{document_id}",
+        update_document,
+        {
+            "operation_id": "update_document",
+            "summary": "Update document",
+            "description": DESCRIPTIONS["update_document"],
+        },
+    ),
+    (
+        "DELETE",
+        "/documents/{client_id}/{collection_name}/{document_id}",
+        delete_document,
+        {
+            "operation_id": "delete_document",
+            "summary": "Delete document",
+            "description": DESCRIPTIONS["delete_document"],
+        },
+    ),
+]
+
+for method, path, handler, options in ROUTES:
+    router.add_api_route(
+        path, handler, methods=[method], response_model=APIResponse, **options
+    )
@@ -1,8 +1,17 @@
 from fastapi import APIRouter, Depends, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from client_service.services.entities_service import EntityService
-from client_service.api.dependencies import get_database_session
+from client_service.api.dependencies import (
+    ETag,
+    PaginationCursor,
+    PaginationLimit,
+    PaginationSkip,
+    get_database_session,
+    get_read_session,
+)
 from client_service.schemas.base_response import APIResponse
+from client_service.utils.response_cache import response_cache
 from client_service.schemas.pydantic_schemas import (
     ClientEntityCreate,
     ClientEntityUpdate
@@ -10,7 +19,7 @@ from client_service.schemas.pydantic_schemas import (
 from uuid import UUID
 from typing import List
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
 @router.post(
@@ -43,18 +52,20 @@ async def create_entity(
 async def search_entities(
     column: str,
     value: str,
-    db: AsyncSession = Depends(get_database_session)
+    etag: ETag,
+    db: AsyncSession = Depends(get_read_session)
 ):
     """
     Search entities by specific column.
     
     Allowed columns: entity_name, client_id, gst_id, company_pan, tan, parent_client_id
     """
-    return await EntityService.search(column, value, db)
+    return etag(await EntityService.search(column, value, db))
 
 
+@router.head("/entities/{entity_id:uuid}", include_in_schema=False)
 @router.get(
-    "/entities/{entity_id}",
+    "/entities/{entity_id:uuid}",
     response_model=APIResponse,
     operation_id="get_entity",
     summary="Get entity by ID",
@@ -62,10 +73,15 @@ async def search_entities(
 )
 async def get_entity(
     entity_id: UUID,
+    etag: ETag,
     db: AsyncSession = Depends(get_database_session)
 ):
     """Get an entity by ID"""
-    return await EntityService.get_by_id(entity_id, db)
+    # Cache misses read the primary so a lagging replica cannot re-cache pre-write data
+    response = await response_cache.get_or_load(
+        "entity", entity_id, lambda: EntityService.get_by_id(entity_id, db)
+    )
+    return etag(response)
 
 
 @router.get(
@@ -76,16 +92,18 @@ async def get_entity(
     description="Lists all entities (branches/locations) across all clients with pagination. Returns array with entity details including associated client_id. Supports skip/limit (max 100). Useful for viewing all branches system-wide.",
 )
 async def get_all_entities(
-    skip: int = 0,
-    limit: int = 100,
-    db: AsyncSession = Depends(get_database_session)
+    etag: ETag,
+    skip: PaginationSkip = 0,
+    limit: PaginationLimit = 100,
+    after: PaginationCursor = None,
+    db: AsyncSession = Depends(get_read_session)
 ):
     """Get all entities with pagination"""
-    return await EntityService.get_all(skip, limit, db)
+    return etag(await EntityService.get_all(skip, limit, db, after))
 
 
 @router.get(
-    "/entities/client/{client_id}",
+    "/entities/client/{client_id:uuid}",
     response_model=APIResponse,
     operation_id="get_client_entities",
     summary="Get entities by client",
@@ -93,14 +111,15 @@ async def get_all_entities(
 )
 async def get_entities_by_client(
     client_id: UUID,
-    db: AsyncSession = Depends(get_database_session)
+    etag: ETag,
+    db: AsyncSession = Depends(get_read_session)
 ):
     """Get all entities by client ID"""
-    return await EntityService.get_by_client_id(client_id, db)
+    return etag(await EntityService.get_by_client_id(client_id, db))
 
 
 @router.put(
-    "/entities/{entity_id}",
+    "/entities/{entity_id:uuid}",
     response_model=APIResponse,
     operation_id="update_entity",
     summary="Update entity",
@@ -112,11 +131,13 @@ async def update_entity(
     db: AsyncSession = Depends(get_database_session)
 ):
     """Update an entity"""
-    return await EntityService.update(entity_id, entity_data, db)
+    response = await EntityService.update(entity_id, entity_data, db)
+    response_cache.invalidate("entity", entity_id)
+    return response
 
 
 @router.delete(
-    "/entities/{entity_id}",
+    "/entities/{entity_id:uuid}",
     response_model=APIResponse,
     operation_id="delete_entity",
     summary="Delete entity",
@@ -127,4 +148,6 @@ async def delete_entity(
     db: AsyncSession = Depends(get_database_session)
 ):
     """Delete an entity"""
-    return await EntityService.delete(entity_id, db)
\ No newline at end of file
+    response = await EntityService.delete(entity_id, db)
+    response_cache.invalidate("entity", entity_id)
+    return response
\ No newline at end of file
@@ -1,8 +1,17 @@
 from fastapi import APIRouter, Depends, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from client_service.services.items_service import ItemService
-from client_service.api.dependencies import get_database_session
+from client_service.api.dependencies import (
+    ETag,
+    PaginationCursor,
+    PaginationLimit,
+    PaginationSkip,
+    get_database_session,
+    get_read_session,
+)
 from client_service.schemas.base_response import APIResponse
+from client_service.utils.response_cache import response_cache
 from client_service.schemas.pydantic_schemas import (
     ItemCreate,
     ItemUpdate
@@ -10,7 +19,7 @@ from client_service.schemas.pydantic_schemas import (
 from uuid import UUID
 from typing import List
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
 @router.post(
@@ -29,8 +38,9 @@ async def create_item(
     return await ItemService.create(item_data, db)
 
 
+@router.head("/items/{item_id:uuid}", include_in_schema=False)
 @router.get(
-    "/items/{item_id}",
+    "/items/{item_id:uuid}",
     response_model=APIResponse,
     operation_id="get_item",
     summary="Get item by ID",
@@ -38,10 +48,15 @@ async def create_item(
 )
 async def get_item(
     item_id: UUID,
+    etag: ETag,
     db: AsyncSession = Depends(get_database_session)
 ):
     """Get an item by ID"""
-    return await ItemService.get_by_id(item_id, db)
+    # Cache misses read the primary so a lagging replica cannot re-cache pre-write data
+    response = await response_cache.get_or_load(
+        "item", item_id, lambda: ItemService.get_by_id(item_id, db)
+    )
+    return etag(response)
 
 
 @router.get(
@@ -52,12 +67,14 @@ async def get_item(
     description="Get all items with pagination. Use when: 'list items', 'show all products'.",
 )
 async def get_all_items(
-    skip: int = 0,
-    limit: int = 100,
-    db: AsyncSession = Depends(get_database_session)
+    etag: ETag,
+    skip: PaginationSkip = 0,
+    limit: PaginationLimit = 100,
+    after: PaginationCursor = None,
+    db: AsyncSession = Depends(get_read_session)
 ):
     """Get all items with pagination"""
-    return await ItemService.get_all(skip, limit, db)
+    return etag(await ItemService.get_all(skip, limit, db, after))
 
 
 @router.get(
@@ -69,14 +86,15 @@ async def get_all_items(
 )
 async def get_item_by_code(
     item_code: str,
-    db: AsyncSession = Depends(get_database_session)
+    etag: ETag,
+    db: AsyncSession = Depends(get_read_session)
 ):
     """Get an item by code"""
-    return await ItemService.get_by_code(item_code, db)
+    return etag(await ItemService.get_by_code(item_code, db))
 
 
 @router.put(
-    "/items/{item_id}",
+    "/items/{item_id:uuid}",
     response_model=APIResponse,
     operation_id="update_item",
     summary="Update item",
@@ -88,11 +106,13 @@ async def update_item(
     db: AsyncSession = Depends(get_database_session)
 ):
     """Update an item"""
-    return await ItemService.update(item_id, item_data, db)
+    response = await ItemService.update(item_id, item_data, db)
+    response_cache.invalidate("item", item_id)
+    return response
 
 
 @router.delete(
-    "/items/{item_id}",
+    "/items/{item_id:uuid}",
     response_model=APIResponse,
     operation_id="delete_item",
     summary="Delete item",
@@ -103,4 +123,6 @@ async def delete_item(
     db: AsyncSession = Depends(get_database_session)
 ):
     """Delete an item"""
-    return await ItemService.delete(item_id, db)
\ No newline at end of file
+    response = await ItemService.delete(item_id, db)
+    response_cache.invalidate("item", item_id)
+    return response
\ No newline at end of file
@@ -1,8 +1,16 @@
 from fastapi import APIRouter, Depends, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from client_service.services.permissions_service import PermissionService
-from client_service.api.dependencies import get_database_session
+from client_service.api.dependencies import (
+    ETag,
+    PaginationCursor,
+    PaginationLimit,
+    PaginationSkip,
+    get_database_session,
+)
 from client_service.schemas.base_response import APIResponse
+from client_service.utils.response_cache import response_cache
 from client_service.schemas.pydantic_schemas import (
     PermissionCreate,
     PermissionUpdate
@@ -10,7 +18,7 @@ from client_service.schemas.pydantic_schemas import (
 from uuid import UUID
 from typing import List
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
 @router.post(
@@ -26,11 +34,14 @@ async def create_permission(
     db: AsyncSession = Depends(get_database_session)
 ):
     """Create a new permission"""
-    return await PermissionService.create(permission_data, db)
+    response = await PermissionService.create(permission_data, db)
+    response_cache.invalidate_namespace("permission_list")
+    return response
 
 
+@router.head("/permissions/{permission_id:uuid}", include_in_schema=False)
 @router.get(
-    "/permissions/{permission_id}",
+    "/permissions/{permission_id:uuid}",
     response_model=APIResponse,
     operation_id="get_permission",
     summary="Get permission by ID",
@@ -38,10 +49,15 @@ async def create_permission(
 )
 async def get_permission(
     permission_id: UUID,
+    etag: ETag,
     db: AsyncSession = Depends(get_database_session)
 ):
     """Get a permission by ID"""
-    return await PermissionService.get_by_id(permission_id, db)
+    # Cache misses read the primary so a lagging replica cannot re-cache pre-write data
+    response = await response_cache.get_or_load(
+        "permission", permission_id, lambda: PermissionService.get_by_id(permission_id, db)
+    )
+    return etag(response)
 
 
 @router.get(
@@ -52,16 +68,23 @@ async def get_permission(
     description="Lists all permissions in the system with pagination. Returns array of permissions with id, name, description, and timestamps. Supports skip/limit (max 100). Useful for assigning permissions to roles.",
 )
 async def get_all_permissions(
-    skip: int = 0,
-    limit: int = 100,
+    etag: ETag,
+    skip: PaginationSkip = 0,
+    limit: PaginationLimit = 100,
+    after: PaginationCursor = None,
     db: AsyncSession = Depends(get_database_session)
 ):
     """Get all permissions with pagination"""
-    return await PermissionService.get_all(skip, limit, db)
+    # Reference table: pages are served from memory until a permission is written
+    # Cache misses read the primary so a lagging replica cannot re-cache pre-write data
+    response = await response_cache.get_or_load(
+        "permission_list", (skip, limit, after), lambda: PermissionService.get_all(skip, limit, db, after)
+    )
+    return etag(response)
 
 
 @router.put(
-    "/permissions/{permission_id}",
+    "/permissions/{permission_id:uuid}",
     response_model=APIResponse,
     operation_id="update_permission",
     summary="Update permission",
@@ -73,11 +96,14 @@ async def update_permission(
     db: AsyncSession = Depends(get_database_session)
 ):
     """Update a permission"""
-    return await PermissionService.update(permission_id, permission_data, db)
+    response = await PermissionService.update(permission_id, permission_data, db)
+    response_cache.invalidate("permission", permission_id)
+    response_cache.invalidate_namespace("permission_list")
+    return response
 
 
 @router.delete(
-    "/permissions/{permission_id}",
+    "/permissions/{permission_id:uuid}",
     response_model=APIResponse,
     operation_id="delete_permission",
     summary="Delete permission",
@@ -88,4 +114,7 @@ async def delete_permission(
     db: AsyncSession = Depends(get_database_session)
 ):
     """Delete a permission"""
-    return await PermissionService.delete(permission_id, db)
\ No newline at end of file
+    response = await PermissionService.delete(permission_id, db)
+    response_cache.invalidate("permission", permission_id)
+    response_cache.invalidate_namespace("permission_list")
+    return response
\ No newline at end of file
@@ -1,8 +1,16 @@
 from fastapi import APIRouter, Depends, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from client_service.services.roles_service import RoleService
-from client_service.api.dependencies import get_database_session
+from client_service.api.dependencies import (
+    ETag,
+    PaginationCursor,
+    PaginationLimit,
+    PaginationSkip,
+    get_database_session,
+)
 from client_service.schemas.base_response import APIResponse
+from client_service.utils.response_cache import response_cache
 from client_service.schemas.pydantic_schemas import (
     RoleCreate,
     RoleUpdate
@@ -10,7 +18,7 @@ from client_service.schemas.pydantic_schemas import (
 from uuid import UUID
 from typing import List
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
 @router.post(
@@ -26,11 +34,14 @@ async def create_role(
     db: AsyncSession = Depends(get_database_session)
 ):
     """Create a new role"""
-    return await RoleService.create(role_data, db)
+    response = await RoleService.create(role_data, db)
+    response_cache.invalidate_namespace("role_list")
+    return response
 
 
+@router.head("/roles/{role_id:uuid}", include_in_schema=False)
 @router.get(
-    "/roles/{role_id}",
+    "/roles/{role_id:uuid}",
     response_model=APIResponse,
     operation_id="get_role",
     summary="Get role by ID",
@@ -38,10 +49,15 @@ async def create_role(
 )
 async def get_role(
     role_id: UUID,
+    etag: ETag,
     db: AsyncSession = Depends(get_database_session)
 ):
     """Get a role by ID"""
-    return await RoleService.get_by_id(role_id, db)
+    # Cache misses read the primary so a lagging replica cannot re-cache pre-write data
+    response = await response_cache.get_or_load(
+        "role", role_id, lambda: RoleService.get_by_id(role_id, db)
+    )
+    return etag(response)
 
 
 @router.get(
@@ -52,16 +68,23 @@ async def get_role(
     description="Lists all roles in the system with pagination. Returns array of roles with id, name, description, and timestamps. Supports skip/limit (max 100). Useful for role selection in user management.",
 )
 async def get_all_roles(
-    skip: int = 0,
-    limit: int = 100,
+    etag: ETag,
+    skip: PaginationSkip = 0,
+    limit: PaginationLimit = 100,
+    after: PaginationCursor = None,
     db: AsyncSession = Depends(get_database_session)
 ):
     """Get all roles with pagination"""
-    return await RoleService.get_all(skip, limit, db)
+    # Reference table: pages are served from memory until a role is written
+    # Cache misses read the primary so a lagging replica cannot re-cache pre-write data
+    response = await response_cache.get_or_load(
+        "role_list", (skip, limit, after), lambda: RoleService.get_all(skip, limit, db, after)
+    )
+    return etag(response)
 
 
 @router.put(
-    "/roles/{role_id}",
+    "/roles/{role_id:uuid}",
     response_model=APIResponse,
     operation_id="update_role",
     summary="Update role",
@@ -73,11 +96,14 @@ async def update_role(
     db: AsyncSession = Depends(get_database_session)
 ):
     """Update a role"""
-    return await RoleService.update(role_id, role_data, db)
+    response = await RoleService.update(role_id, role_data, db)
+    response_cache.invalidate("role", role_id)
+    response_cache.invalidate_namespace("role_list")
+    return response
 
 
 @router.delete(
-    "/roles/{role_id}",
+    "/roles/{role_id:uuid}",
     response_model=APIResponse,
     operation_id="delete_role",
     summary="Delete role",
@@ -88,4 +114,7 @@ async def delete_role(
     db: AsyncSession = Depends(get_database_session)
 ):
     """Delete a role"""
-    return await RoleService.delete(role_id, db)
\ No newline at end of file
+    response = await RoleService.delete(role_id, db)
+    response_cache.invalidate("role", role_id)
+    response_cache.invalidate_namespace("role_list")
+    return response
\ No newline at end of file
@@ -25,11 +25,12 @@ api_router.include_router(roles_router, prefix="/api/v1", tags=["Roles"])
 api_router.include_router(permissions_router, prefix="/api/v1", tags=["Permissions"])
 api_router.include_router(user_roles_router, prefix="/api/v1", tags=["User Roles"])
 api_router.include_router(role_permissions_router, prefix="/api/v1", tags=["Role Permissions"])
+# Static /vendors/classifications paths must be matched before /vendors/{vendor_id}
+api_router.include_router(vendor_classification_router, prefix="/api/v1", tags=["Vendor Classifications"])
 api_router.include_router(vendors_router, prefix="/api/v1", tags=["Vendors"])
 api_router.include_router(transactions_router, prefix="/api/v1", tags=["Transactions"])
 api_router.include_router(items_router, prefix="/api/v1", tags=["Items"])
 api_router.include_router(expenses_router, prefix="/api/v1", tags=["Expenses"])
-api_router.include_router(vendor_classification_router, prefix="/api/v1", tags=["Vendor Classifications"])
 api_router.include_router(workflows_router, prefix="/api/v1", tags=["Workflows"])
 api_router.include_router(logs_router, prefix="/api/v1", tags=["Logs"])
 api_router.include_router(client_schema_router, prefix="/api/v1", tags=["Client Schemas"])
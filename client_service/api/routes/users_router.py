@@ -1,8 +1,17 @@
 from fastapi import APIRouter, Depends, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from client_service.services.users_service import UserService
-from client_service.api.dependencies import get_database_session
+from client_service.api.dependencies import (
+    ETag,
+    PaginationCursor,
+    PaginationLimit,
+    PaginationSkip,
+    get_database_session,
+    get_read_session,
+)
 from client_service.schemas.base_response import APIResponse
+from client_service.utils.response_cache import response_cache
 from client_service.schemas.pydantic_schemas import (
     UserCreate,
     UserUpdate
@@ -10,7 +19,7 @@ from client_service.schemas.pydantic_schemas import (
 from uuid import UUID
 from typing import List
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
 @router.post(
@@ -29,8 +38,9 @@ async def create_user(
     return await UserService.create(user_data, db)
 
 
+@router.head("/users/{user_id:uuid}", include_in_schema=False)
 @router.get(
-    "/users/{user_id}",
+    "/users/{user_id:uuid}",
     response_model=APIResponse,
     operation_id="get_user",
     summary="Get user by ID",
@@ -38,10 +48,15 @@ async def create_user(
 )
 async def get_user(
     user_id: UUID,
+    etag: ETag,
     db: AsyncSession = Depends(get_database_session)
 ):
     """Get a user by ID"""
-    return await UserService.get_by_id(user_id, db)
+    # Cache misses read the primary so a lagging replica cannot re-cache pre-write data
+    response = await response_cache.get_or_load(
+        "user", user_id, lambda: UserService.get_by_id(user_id, db)
+    )
+    return etag(response)
 
 
 @router.get(
@@ -52,16 +67,18 @@ async def get_user(
     description="Lists all users across all clients with pagination. Returns array of users with id, name, email, phone, client_id, and timestamps. Supports skip/limit (max 100). Useful for user management dashboards.",
 )
 async def get_all_users(
-    skip: int = 0,
-    limit: int = 100,
-    db: AsyncSession = Depends(get_database_session)
+    etag: ETag,
+    skip: PaginationSkip = 0,
+    limit: PaginationLimit = 100,
+    after: PaginationCursor = None,
+    db: AsyncSession = Depends(get_read_session)
 ):
     """Get all users with pagination"""
-    return await UserService.get_all(skip, limit, db)
+    return etag(await UserService.get_all(skip, limit, db, after))
 
 
 @router.put(
-    "/users/{user_id}",
+    "/users/{user_id:uuid}",
     response_model=APIResponse,
     operation_id="update_user",
     summary="Update user information",
@@ -73,11 +90,13 @@ async def update_user(
     db: AsyncSession = Depends(get_database_session)
 ):
     """Update a user"""
-    return await UserService.update(user_id, user_data, db)
+    response = await UserService.update(user_id, user_data, db)
+    response_cache.invalidate("user", user_id)
+    return response
 
 
 @router.delete(
-    "/users/{user_id}",
+    "/users/{user_id:uuid}",
     response_model=APIResponse,
     operation_id="delete_user",
     summary="Delete user",
@@ -88,4 +107,6 @@ async def delete_user(
     db: AsyncSession = Depends(get_database_session)
 ):
     """Delete a user"""
-    return await UserService.delete(user_id, db)
\ No newline at end of file
+    response = await UserService.delete(user_id, db)
+    response_cache.invalidate("user", user_id)
+    return response
\ No newline at end of file
@@ -12,17 +12,37 @@ DB_PASSWORD = os.getenv("DB_PASSWORD")
 DB_HOST = os.getenv("DB_HOST")
 DB_PORT = os.getenv("DB_PORT")
 
+# Connection pool configuration (per worker process).
+# Each worker can open up to DB_POOL_SIZE + DB_MAX_OVERFLOW connections, so keep
+# workers * (DB_POOL_SIZE + DB_MAX_OVERFLOW) below Postgres max_connections.
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 20))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 10))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", 10))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", 1800))
+# LIFO reuses the most recently returned connections and lets idle extras time out
+DB_POOL_USE_LIFO = os.getenv("DB_POOL_USE_LIFO", "true").lower() == "true"
+DB_ECHO = os.getenv("DB_ECHO", "false").lower() == "true"
+
+# Statement caching: SQLAlchemy compiled-SQL cache and asyncpg prepared statements per connection
+DB_QUERY_CACHE_SIZE = int(os.getenv("DB_QUERY_CACHE_SIZE", 1200))
+DB_STATEMENT_CACHE_SIZE = int(os.getenv("DB_STATEMENT_CACHE_SIZE", 1024))
+
 # Create async database URL
 DATABASE_URL = f"postgresql+asyncpg://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
 
 # Create async engine
 engine = create_async_engine(
     DATABASE_URL,
-    echo=True,
+    echo=DB_ECHO,
     future=True,
     pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_timeout=DB_POOL_TIMEOUT,
+    pool_recycle=DB_POOL_RECYCLE,
+    pool_use_lifo=DB_POOL_USE_LIFO,
+    query_cache_size=DB_QUERY_CACHE_SIZE,
+    connect_args={"prepared_statement_cache_size": DB_STATEMENT_CACHE_SIZE}
 )
 
 # Create async session factory
@@ -32,6 +52,35 @@ async_session_maker = async_sessionmaker(
     expire_on_commit=False
 )
 
+# Optional read replica for read-only routes; falls back to the primary when unset
+DB_REPLICA_HOST = os.getenv("DB_REPLICA_HOST")
+DB_REPLICA_PORT = os.getenv("DB_REPLICA_PORT", DB_PORT)
+DB_REPLICA_POOL_SIZE = int(os.getenv("DB_REPLICA_POOL_SIZE", 30))
+
+if DB_REPLICA_HOST:
+    REPLICA_DATABASE_URL = f"postgresql+asyncpg://{DB_USER}:{DB_PASSWORD}@{DB_REPLICA_HOST}:{DB_REPLICA_PORT}/{DB_NAME}"
+    read_engine = create_async_engine(
+        REPLICA_DATABASE_URL,
+        echo=DB_ECHO,
+        future=True,
+        pool_pre_ping=True,
+        pool_size=DB_REPLICA_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_recycle=DB_POOL_RECYCLE,
+        pool_use_lifo=DB_POOL_USE_LIFO,
+        query_cache_size=DB_QUERY_CACHE_SIZE,
+        connect_args={"prepared_statement_cache_size": DB_STATEMENT_CACHE_SIZE}
+    )
+else:
+    read_engine = engine
+
+read_session_maker = async_sessionmaker(
+    read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False
+)
+
 # Base class for models
 Base = declarative_base()
 
@@ -46,12 +95,17 @@ async def init_db():
 async def get_db():
     """Dependency for getting database session"""
     async with async_session_maker() as session:
-        try:
-            yield session
-        finally:
-            await session.close()
+        yield session
+
+
+async def get_read_db():
+    """Dependency for getting a read-only database session (replica when configured)"""
+    async with read_session_maker() as session:
+        yield session
 
 
 async def close_db():
     """Close database connections"""
-    await engine.dispose()
\ No newline at end of file
+    await engine.dispose()
+    if read_engine is not engine:
+        await read_engine.dispose()
\ No newline at end of file
@@ -39,6 +39,7 @@ app.include_router(api_router)
 
 # 👇 THIS PART makes the "Authorize" button appear
 def custom_openapi():
+    # Built once on first request, then served from app.openapi_schema
     if app.openapi_schema:
         return app.openapi_schema
     openapi_schema = get_openapi(
@@ -86,6 +87,12 @@ def main():
         reload=os.getenv("RELOAD", "true").lower() == "true",
         log_level=os.getenv("LOG_LEVEL", "info").lower(),
         workers=int(os.getenv("WORKERS", 1)),
+        # "auto" picks uvloop and httptools when installed, else asyncio and h11
+        loop=os.getenv("UVICORN_LOOP", "auto"),
+        http=os.getenv("UVICORN_HTTP", "auto"),
+        # Keep idle connections open so bursts of small CRUD calls reuse them;
+        # should stay above the idle timeout of any proxy in front
+        timeout_keep_alive=int(os.getenv("KEEP_ALIVE_TIMEOUT", 75)),
     )
 
 
@@ -4,7 +4,7 @@ File: ginthi_agents/client_service/schemas/base_response.py
 """
 
 from pydantic import BaseModel
-from typing import Optional, Any
+from typing import Optional, Any, Dict
 
 
 class APIResponse(BaseModel):
@@ -18,6 +18,14 @@ class APIResponse(BaseModel):
             "data": {...}
         }
     
+    Example Paginated List:
+        {
+            "success": true,
+            "message": "Retrieved 100 items",
+            "data": [...],
+            "meta": {"next_cursor": "..."}
+        }
+    
     Example Error:
         {
             "success": false,
@@ -27,4 +35,5 @@ class APIResponse(BaseModel):
     """
     success: bool
     message: Optional[str] = None
-    data: Optional[Any] = None
\ No newline at end of file
+    data: Optional[Any] = None
+    meta: Optional[Dict[str, Any]] = None
\ No newline at end of file
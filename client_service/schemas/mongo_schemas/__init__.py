@@ -1,4 +1,9 @@
-from .client_schema_model import ClientSchema, SchemaField
+from .client_schema_model import (
+    ClientSchema,
+    ClientSchemaProjection,
+    ClientSchemaVersion,
+    SchemaField,
+)
 from .dynamic_document_model import (
     DynamicCollectionConfig,
     get_or_create_collection_config,
@@ -20,6 +25,8 @@ from .client_workflow_execution import (
 
 __all__ = [
     "ClientSchema",
+    "ClientSchemaProjection",
+    "ClientSchemaVersion",
     "SchemaField",
     "DynamicCollectionConfig",
     "get_or_create_collection_config",
@@ -1,9 +1,12 @@
 from beanie import Document
+from pymongo import ASCENDING, DESCENDING, IndexModel
 from pydantic import BaseModel, Field, field_validator
 from typing import Optional, List, Any, Dict
 from datetime import datetime, timezone
 from uuid import UUID
 
+from client_service.schemas.pydantic_schemas import ClientSchemaResponse
+
 
 class SchemaField(BaseModel):  # ← Must be BaseModel, NOT Document
     """
@@ -59,4 +62,49 @@ class ClientSchema(Document):
             raise ValueError(f"client_id must be a valid UUID string, got: {v}")
 
     class Settings:
-        name = "client_schemas"
\ No newline at end of file
+        name = "client_schemas"
+        indexes = [
+            # Serves version lookups per (client_id, schema_name), newest first
+            IndexModel(
+                [("client_id", ASCENDING), ("schema_name", ASCENDING), ("version", DESCENDING)]
+            ),
+            # Small index over active versions only, serves get_active_schema and deactivation
+            IndexModel(
+                [("client_id", ASCENDING), ("schema_name", ASCENDING)],
+                name="client_id_1_schema_name_1_active",
+                partialFilterExpression={"is_active": True},
+            ),
+        ]
+
+
+class ClientSchemaVersion(BaseModel):
+    """Projection of the fields needed to pick the next schema version"""
+    client_id: str
+    schema_name: str
+    version: int
+
+
+class ClientSchemaProjection(ClientSchemaResponse):
+    """
+    Projection for list endpoints: loads only the fields the response needs
+    and dumps straight into the response shape
+    """
+
+    @field_validator('id', mode='before')
+    @classmethod
+    def stringify_id(cls, v):
+        """ObjectId comes back from MongoDB, the response carries it as a string"""
+        return str(v)
+
+    class Settings:
+        projection = {
+            "_id": 1,
+            "client_id": 1,
+            "schema_name": 1,
+            "version": 1,
+            "is_active": 1,
+            "description": 1,
+            "fields": 1,
+            "created_at": 1,
+            "updated_at": 1,
+        }
@@ -1,14 +1,48 @@
+import asyncio
+import hashlib
 import logging
+import os
+from collections import OrderedDict
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Type
+from types import MappingProxyType
+from typing import Any, Dict, List, Optional, Tuple, Type
 from uuid import UUID
 
 from motor.motor_asyncio import AsyncIOMotorCollection
 from client_service.db.mongo_db import get_mongo_db
 from bson import ObjectId
+from bson.codec_options import TypeDecoder, TypeRegistry
+from pymongo import IndexModel
 
 logger = logging.getLogger(__name__)
 
+class _ObjectIdToStr(TypeDecoder):
+    """Decode ObjectIds read from dynamic collections straight to hex strings"""
+
+    bson_type = ObjectId
+
+    def transform_bson(self, value: ObjectId) -> str:
+        return str(value)
+
+
+_OBJECT_ID_TYPE_REGISTRY = TypeRegistry([_ObjectIdToStr()])
+
+# Indexes every dynamic collection gets for common query patterns
+COMMON_INDEXES = [
+    IndexModel("client_id"),
+    IndexModel("created_at"),
+    IndexModel("updated_at"),
+]
+
+# Collections whose common indexes were already ensured by this process
+_indexed_collections: set = set()
+
+# Unique-field signature each collection was last indexed for, keyed by collection name
+_schema_index_signatures: Dict[str, str] = {}
+
+# Detached index drops, referenced here so they are not garbage collected mid-run
+_pending_index_tasks: set = set()
+
 
 class DynamicCollectionConfig:
     """
@@ -28,6 +62,7 @@ class DynamicCollectionConfig:
         self.client_id = client_id
         self.collection = collection
         self.field_map = {field["name"]: field for field in fields}
+        self.field_checks = compile_field_checks(fields)
 
     def get_field_type(self, field_name: str) -> Optional[str]:
         """Get the type of a field"""
@@ -50,6 +85,53 @@ class DynamicCollectionConfig:
         return field.get("allowed_values") if field else None
 
 
+# Accepted Python types and error label per schema field type
+_TYPE_CHECKS = {
+    "string": (str, "string"),
+    "number": ((int, float), "number"),
+    "boolean": (bool, "boolean"),
+    "array": (list, "array"),
+    "object": (dict, "object"),
+    "date": (str, "date string (ISO format)"),
+}
+
+
+def compile_field_checks(fields: List[Dict[str, Any]]) -> List[Tuple]:
+    """
+    Resolve each field definition once into a flat validation rule.
+
+    Args:
+        fields: List of field definitions
+
+    Returns:
+        List of (name, required, expected_type, type_name, allowed_values) tuples
+    """
+    checks = []
+    for field in fields:
+        expected_type, type_name = _TYPE_CHECKS.get(field["type"], (None, None))
+        checks.append(
+            (
+                field["name"],
+                field.get("required", False),
+                expected_type,
+                type_name,
+                field.get("allowed_values"),
+            )
+        )
+    return checks
+
+
+# Python type per schema field type
+_PYTHON_TYPES = MappingProxyType({
+    "string": str,
+    "number": float,
+    "date": datetime,
+    "boolean": bool,
+    "array": list,
+    "object": dict,
+})
+
+
 def get_python_type(field_type: str) -> Type:
     """
     Convert schema field type string to Python type.
@@ -60,16 +142,7 @@ def get_python_type(field_type: str) -> Type:
     Returns:
         Python type class
     """
-    type_mapping = {
-        "string": str,
-        "number": float,
-        "date": datetime,
-        "boolean": bool,
-        "array": list,
-        "object": dict,
-    }
-
-    return type_mapping.get(field_type, str)
+    return _PYTHON_TYPES.get(field_type, str)
 
 
 def prepare_document_for_insert(
@@ -77,6 +150,7 @@ def prepare_document_for_insert(
     client_id: str,
     created_by: Optional[str] = None,
     updated_by: Optional[str] = None,
+    now: Optional[datetime] = None,
 ) -> Dict[str, Any]:
     """
     Prepare a document dictionary for insertion into MongoDB.
@@ -87,11 +161,12 @@ def prepare_document_for_insert(
         client_id: UUID of the client
         created_by: UUID of user creating the document
         updated_by: UUID of user updating the document
+        now: Timestamp to stamp the document with, so batch callers can share one
 
     Returns:
         Complete document ready for MongoDB insertion
     """
-    now = datetime.now(timezone.utc)
+    now = now or datetime.now(timezone.utc)
 
     return {
         "client_id": client_id,
@@ -104,7 +179,9 @@ def prepare_document_for_insert(
 
 
 def prepare_document_for_update(
-    data: Dict[str, Any], updated_by: Optional[str] = None
+    data: Dict[str, Any],
+    updated_by: Optional[str] = None,
+    now: Optional[datetime] = None,
 ) -> Dict[str, Any]:
     """
     Prepare update data for MongoDB update operation.
@@ -113,13 +190,14 @@ def prepare_document_for_update(
     Args:
         data: Fields to update
         updated_by: UUID of user updating the document
+        now: Timestamp to stamp the update with, defaults to the current time
 
     Returns:
         Update operation dict for MongoDB
     """
     update_fields = {
         **data,
-        "updated_at": datetime.now(timezone.utc),
+        "updated_at": now or datetime.now(timezone.utc),
         "updated_by": updated_by,
     }
 
@@ -129,7 +207,8 @@ def prepare_document_for_update(
 def serialize_document(doc: Dict[str, Any]) -> Dict[str, Any]:
     """
     Serialize a MongoDB document for API response.
-    Converts ObjectId to string and handles datetime serialization.
+    ObjectIds are decoded to strings by the collection codec, and datetime
+    values are left as-is for the response encoder to emit as ISO 8601.
 
     Args:
         doc: Raw document from MongoDB
@@ -137,20 +216,6 @@ def serialize_document(doc: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         JSON-serializable dictionary
     """
-    if not doc:
-        return doc
-
-    # Convert ObjectId to string
-    if "_id" in doc:
-        doc["_id"] = str(doc["_id"])
-
-    # Convert datetime objects to ISO format strings
-    for key, value in doc.items():
-        if isinstance(value, datetime):
-            doc[key] = value.isoformat()
-        elif isinstance(value, ObjectId):
-            doc[key] = str(value)
-
     return doc
 
 
@@ -166,20 +231,27 @@ async def get_collection(schema_name: str) -> AsyncIOMotorCollection:
         AsyncIOMotorCollection instance
     """
     db = get_mongo_db()
-    collection = db[schema_name]
+    collection = db.get_collection(
+        schema_name,
+        codec_options=db.codec_options.with_options(type_registry=_OBJECT_ID_TYPE_REGISTRY),
+    )
 
-    # Create indexes for common query patterns
-    await collection.create_index("client_id")
-    await collection.create_index("created_at")
-    await collection.create_index("updated_at")
+    # Ensure common indexes once per process, in a single round-trip
+    if schema_name not in _indexed_collections:
+        await collection.create_indexes(COMMON_INDEXES)
+        _indexed_collections.add(schema_name)
 
     logger.info(f"Retrieved/created Motor collection: {schema_name}")
 
     return collection
 
 
-# Global registry to store collection configurations
-_collection_registry: Dict[str, DynamicCollectionConfig] = {}
+# Global registry to store collection configurations, least recently used first
+_collection_registry: "OrderedDict[str, DynamicCollectionConfig]" = OrderedDict()
+COLLECTION_REGISTRY_MAX_ENTRIES = int(os.getenv("COLLECTION_REGISTRY_MAX_ENTRIES", 1024))
+
+# Per-key locks so concurrent first requests for a schema build its config once
+_registry_locks: Dict[str, asyncio.Lock] = {}
 
 
 async def get_or_create_collection_config(
@@ -200,30 +272,43 @@ async def get_or_create_collection_config(
     # Create unique key for this configuration
     config_key = f"{client_id}_{schema_name}"
 
-    if config_key not in _collection_registry:
-        # Get Motor collection
-        collection = await get_collection(schema_name)
+    config = _collection_registry.get(config_key)
+    if config is not None:
+        _collection_registry.move_to_end(config_key)
+        logger.debug(f"Using existing collection config: {config_key}")
+        return config
+
+    lock = _registry_locks.setdefault(config_key, asyncio.Lock())
+    async with lock:
+        # Another request may have registered the config while we waited
+        config = _collection_registry.get(config_key)
+        if config is None:
+            # Get Motor collection
+            collection = await get_collection(schema_name)
+
+            # Create configuration
+            config = DynamicCollectionConfig(
+                schema_name=schema_name,
+                fields=fields,
+                client_id=client_id,
+                collection=collection,
+            )
 
-        # Create configuration
-        config = DynamicCollectionConfig(
-            schema_name=schema_name,
-            fields=fields,
-            client_id=client_id,
-            collection=collection,
-        )
+            _collection_registry[config_key] = config
+            if len(_collection_registry) > COLLECTION_REGISTRY_MAX_ENTRIES:
+                _collection_registry.popitem(last=False)
+            logger.info(f"Registered new collection config: {config_key}")
 
-        _collection_registry[config_key] = config
-        logger.info(f"Registered new collection config: {config_key}")
-    else:
-        logger.info(f"Using existing collection config: {config_key}")
+    if _registry_locks.get(config_key) is lock:
+        del _registry_locks[config_key]
 
-    return _collection_registry[config_key]
+    return config
 
 
 def clear_collection_registry():
     """Clear the collection registry (useful for testing)"""
-    global _collection_registry
-    _collection_registry = {}
+    _collection_registry.clear()
+    _registry_locks.clear()
     logger.info("Collection registry cleared")
 
 
@@ -238,38 +323,53 @@ async def create_indexes_for_schema(
     """
     Create indexes based on schema field definitions.
     Also removes old unique indexes that are no longer marked as unique.
+    Skipped entirely when the collection was already indexed for the same unique fields.
     
     Args:
         collection: Motor collection
         fields: List of field definitions from schema
     """
+    signature = hashlib.blake2b(
+        repr(sorted((field["name"], bool(field.get("unique", False))) for field in fields)).encode(),
+        digest_size=8,
+    ).hexdigest()
+    if _schema_index_signatures.get(collection.name) == signature:
+        return
+    
     # Get existing indexes
     existing_indexes = await collection.list_indexes().to_list(length=None)
+    existing_index_names = {index_info.get("name") for index_info in existing_indexes}
     
     # Track which unique indexes should exist
     required_unique_indexes = set()
+    missing_index_models = []
     
-    # Create indexes for fields marked as unique
+    # Compound index with client_id ensures uniqueness per client
     for field in fields:
         if field.get("unique", False):
             field_name = field["name"]
             index_name = f"{field_name}_1_client_id_1"
             required_unique_indexes.add(index_name)
             
-            # Create compound index with client_id to ensure uniqueness per client
-            try:
-                await collection.create_index(
-                    [(field_name, 1), ("client_id", 1)], 
-                    unique=True,
-                    name=index_name
+            if index_name not in existing_index_names:
+                missing_index_models.append(
+                    IndexModel([(field_name, 1), ("client_id", 1)], unique=True, name=index_name)
                 )
-                logger.info(
-                    f"Created unique compound index on ({field_name}, client_id) for collection {collection.name}"
-                )
-            except Exception as e:
-                logger.warning(f"Index {index_name} may already exist: {e}")
     
-    # Drop unique indexes that are no longer needed
+    # Create all missing unique indexes in one round-trip
+    indexes_ok = True
+    if missing_index_models:
+        try:
+            created = await collection.create_indexes(missing_index_models)
+            logger.info(
+                f"Created unique compound indexes {created} for collection {collection.name}"
+            )
+        except Exception as e:
+            indexes_ok = False
+            logger.warning(f"Could not create unique indexes for collection {collection.name}: {e}")
+    
+    # Unique indexes that are no longer needed
+    obsolete_index_names = []
     for index_info in existing_indexes:
         index_name = index_info.get("name")
         is_unique = index_info.get("unique", False)
@@ -280,11 +380,34 @@ async def create_indexes_for_schema(
         
         # If it's a unique index with our naming pattern and not in required list, drop it
         if is_unique and "_1_client_id_1" in index_name and index_name not in required_unique_indexes:
-            try:
-                await collection.drop_index(index_name)
-                logger.info(f"Dropped obsolete unique index: {index_name} from collection {collection.name}")
-            except Exception as e:
-                logger.warning(f"Could not drop index {index_name}: {e}")
+            obsolete_index_names.append(index_name)
+    
+    # Remember the signature only once the collection matches it
+    if indexes_ok:
+        _schema_index_signatures[collection.name] = signature
+    
+    # Dropping only relaxes constraints, so it runs detached instead of delaying the request
+    if obsolete_index_names:
+        task = asyncio.create_task(
+            _drop_obsolete_indexes(collection, obsolete_index_names, signature)
+        )
+        _pending_index_tasks.add(task)
+        task.add_done_callback(_pending_index_tasks.discard)
+
+
+async def _drop_obsolete_indexes(
+    collection: AsyncIOMotorCollection, index_names: List[str], signature: str
+):
+    """Drop unique indexes removed from the schema, forgetting the signature on failure"""
+    for index_name in index_names:
+        try:
+            await collection.drop_index(index_name)
+            logger.info(f"Dropped obsolete unique index: {index_name} from collection {collection.name}")
+        except Exception as e:
+            logger.warning(f"Could not drop index {index_name}: {e}")
+            if _schema_index_signatures.get(collection.name) == signature:
+                del _schema_index_signatures[collection.name]
+
 
 async def validate_document_against_config(
     data: Dict[str, Any], config: DynamicCollectionConfig
@@ -302,39 +425,21 @@ async def validate_document_against_config(
     """
     errors = []
 
-    for field in config.fields:
-        field_name = field["name"]
-        field_type = field["type"]
-        required = field.get("required", False)
-        allowed_values = field.get("allowed_values")
-
-        # Check required fields
-        if required and field_name not in data:
-            errors.append(f"Required field '{field_name}' is missing")
-            continue
-
+    # Rules were resolved once when the config was created
+    for field_name, required, expected_type, type_name, allowed_values in config.field_checks:
         # Skip if field not provided and not required
         if field_name not in data:
+            if required:
+                errors.append(f"Required field '{field_name}' is missing")
             continue
 
         value = data[field_name]
 
         # Type validation
-        type_checks = {
-            "string": (str, "string"),
-            "number": ((int, float), "number"),
-            "boolean": (bool, "boolean"),
-            "array": (list, "array"),
-            "object": (dict, "object"),
-            "date": (str, "date string (ISO format)"),
-        }
-
-        if field_type in type_checks:
-            expected_type, type_name = type_checks[field_type]
-            if not isinstance(value, expected_type):
-                errors.append(
-                    f"Field '{field_name}' must be {type_name}, got {type(value).__name__}"
-                )
+        if expected_type is not None and not isinstance(value, expected_type):
+            errors.append(
+                f"Field '{field_name}' must be {type_name}, got {type(value).__name__}"
+            )
 
         # Enum validation
         if allowed_values and value not in allowed_values:
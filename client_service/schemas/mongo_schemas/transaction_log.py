@@ -1,7 +1,9 @@
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional, Any, Dict
 from pydantic import BaseModel, Field
 
+_UTC = timezone.utc
+
 
 class TransactionLogModel(BaseModel):
     user: Optional[str] = Field(default="anonymous")
@@ -14,8 +16,10 @@ class TransactionLogModel(BaseModel):
     request_body: Optional[Dict[str, Any]] = None
     response_body: Optional[Dict[str, Any]] = None
     service_name: Optional[str] = Field(default="client_service")
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=lambda: datetime.now(_UTC))
     class Config:
-        orm_mode = True
+        from_attributes = True
+        # Build the validator on first use instead of at import time
+        defer_build = True
     class Settings:
         name = "transactions_logs"     
\ No newline at end of file
@@ -1,9 +1,11 @@
-import json
 import os
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import List, Dict, Any
 
+import orjson
 import requests
 from dotenv import load_dotenv
 import re
@@ -19,26 +21,64 @@ def chunked(iterable: List[Any], size: int):
 def load_seed(seed_path: Path) -> List[Dict[str, Any]]:
     if not seed_path.exists():
         raise FileNotFoundError(f"Seed file not found: {seed_path}")
-    with seed_path.open("r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = orjson.loads(seed_path.read_bytes())
     if not isinstance(data, list):
         raise ValueError("Seed file must contain a JSON array of vendors")
     return data
 
 
 def post_batch(session: requests.Session, url: str, batch: List[Dict[str, Any]]):
-    resp = session.post(url, json=batch, timeout=60)
+    # Send pre-encoded bytes; Content-Type already comes from the session headers
+    resp = session.post(url, data=orjson.dumps(batch), timeout=60)
     return resp
 
 
+def _parse(resp: requests.Response) -> Any:
+    """Decode a JSON response body straight from bytes"""
+    return orjson.loads(resp.content)
+
+
 PLACEHOLDER_VALUES = {"-", "", None}
 
+# Sanitization constants, built once instead of per vendor
+_OPTIONAL_FIELDS = (
+    "email",
+    "gst_id",
+    "company_pan",
+    "tan",
+    "bank_acc_no",
+    "beneficiary_name",
+    "ifsc_code",
+    "payment_term_days",
+    "user_phone",
+)
+
+# Max lengths defined in schema
+_MAX_LEN = {
+    "vendor_name": 255,
+    "vendor_code": 50,
+    "gst_id": 15,
+    "company_pan": 10,
+    "tan": 10,
+    "bank_acc_no": 20,
+    "beneficiary_name": 255,
+    "ifsc_code": 11,
+    "user_phone": 15,
+}
+
+_EMAIL_WRAPPERS = "\"'<>`"
+_EMAIL_DISALLOWED = frozenset(";, ()")
+# Basic RFC-lite check: local@domain.tld without spaces/quotes
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+_CODE_CLEAN_RE = re.compile(r"[^A-Z0-9 ]+")
+_SPACES_RE = re.compile(r"\s+")
+
 
 def _generate_vendor_code(name: str | None) -> str:
     base = (name or "VENDOR").upper()
     # Keep only letters, numbers, and spaces for base, then compress spaces to '-'
-    base = re.sub(r"[^A-Z0-9 ]+", "", base).strip()
-    base = re.sub(r"\s+", "-", base)
+    base = _CODE_CLEAN_RE.sub("", base).strip()
+    base = _SPACES_RE.sub("-", base)
     if not base:
         base = "VENDOR"
     # Ensure base length leaves room for suffix
@@ -52,53 +92,26 @@ def _sanitize_vendor(v: Dict[str, Any]) -> Dict[str, Any]:
     v = dict(v)  # shallow copy
 
     # Normalize placeholders to None for optional fields
-    optional_fields = [
-        "email",
-        "gst_id",
-        "company_pan",
-        "tan",
-        "bank_acc_no",
-        "beneficiary_name",
-        "ifsc_code",
-        "payment_term_days",
-        "user_phone",
-    ]
-
-    for key in optional_fields:
+    for key in _OPTIONAL_FIELDS:
         if key in v and v[key] in PLACEHOLDER_VALUES:
             v[key] = None
 
     # Email: unescape, clean wrappers, and validate or drop
     email = v.get("email")
     if isinstance(email, str):
-        cleaned = unescape(email).strip()
-        # Strip common wrappers
-        for ch in ['"', "'", '<', '>', '`']:
-            cleaned = cleaned.strip(ch)
+        # Strip common wrappers in one pass
+        cleaned = unescape(email).strip().strip(_EMAIL_WRAPPERS)
         # Drop if it contains disallowed chars
-        if any(c in cleaned for c in [';', ',', ' ', '(', ')']):
+        if not _EMAIL_DISALLOWED.isdisjoint(cleaned):
             v["email"] = None
         else:
-            # Basic RFC-lite check: local@domain.tld without spaces/quotes
-            email_pattern = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
-            if not email_pattern.match(cleaned):
+            if not _EMAIL_RE.match(cleaned):
                 v["email"] = None
             else:
                 v["email"] = cleaned
 
     # Enforce max lengths defined in schema
-    max_len = {
-        "vendor_name": 255,
-        "vendor_code": 50,
-        "gst_id": 15,
-        "company_pan": 10,
-        "tan": 10,
-        "bank_acc_no": 20,
-        "beneficiary_name": 255,
-        "ifsc_code": 11,
-        "user_phone": 15,
-    }
-    for k, m in max_len.items():
+    for k, m in _MAX_LEN.items():
         if k in v and isinstance(v[k], str) and v[k] is not None:
             v[k] = v[k][:m]
 
@@ -114,6 +127,101 @@ def _sanitize_vendor(v: Dict[str, Any]) -> Dict[str, Any]:
     return v
 
 
+_thread_local = threading.local()
+
+
+def _thread_session(headers: Dict[str, str]) -> requests.Session:
+    """Return a requests.Session owned by the current worker thread"""
+    session = getattr(_thread_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        session.headers.update(headers)
+        _thread_local.session = session
+    return session
+
+
+def seed_item(url: str, headers: Dict[str, str], item: Dict[str, Any]):
+    """Post a single vendor, regenerating its vendor_code once on conflict"""
+    session = _thread_session(headers)
+    # Items come from batches that main() already sanitized
+    single = item
+    r = post_batch(session, url, [single])
+    if r.status_code in (200, 201):
+        return 1, 0, None
+    elif r.status_code == 409:
+        # Try regenerating vendor_code once and retry
+        retry_item = dict(single)
+        retry_item["vendor_code"] = _generate_vendor_code(retry_item.get("vendor_name"))
+        r2 = post_batch(session, url, [retry_item])
+        if r2.status_code in (200, 201):
+            return 1, 0, None
+        try:
+            detail = _parse(r2).get("detail")
+        except Exception:
+            detail = r2.text
+        code = single.get("vendor_code")
+        print(f"Skip duplicate vendor_code={code} after retry: {detail}")
+        return 0, 1, None
+    elif r.status_code == 422:
+        try:
+            err = _parse(r)
+        except Exception:
+            err = r.text
+        print(f"Validation failed for vendor_code={item.get('vendor_code')}: {err}")
+        return 0, 0, {
+            "vendor_code": item.get("vendor_code"),
+            "vendor_name": item.get("vendor_name"),
+            "error": err,
+            "record": item,
+        }
+    else:
+        try:
+            body = _parse(r)
+        except Exception:
+            body = r.text
+        print(f"Failed to create vendor_code={item.get('vendor_code')}: {r.status_code} {body}")
+        return 0, 0, None
+
+
+def seed_batch(url: str, headers: Dict[str, str], batch: List[Dict[str, Any]]):
+    """Post one batch, retrying items individually on conflict/validation errors"""
+    session = _thread_session(headers)
+    created_count = 0
+    skipped_count = 0
+    failed_items: List[Dict[str, Any]] = []
+
+    resp = post_batch(session, url, batch)
+    if resp.status_code in (200, 201):
+        data = _parse(resp)
+        # APIResponse: { success, message, data: [vendors] }
+        created = len(data.get("data") or [])
+        created_count += created
+        print(f"Created {created} vendors (batch)")
+        return created_count, skipped_count, failed_items
+
+    # If conflict or validation error on batch, try item-by-item
+    if resp.status_code in (409, 422):
+        print("Batch conflict detected, retrying items individually...")
+        # Items are independent, so retry them concurrently instead of one round trip at a time
+        retry_workers = int(os.getenv("SEED_RETRY_WORKERS", "16"))
+        with ThreadPoolExecutor(max_workers=retry_workers) as pool:
+            futures = [pool.submit(seed_item, url, headers, item) for item in batch]
+            for future in as_completed(futures):
+                created, skipped, failed = future.result()
+                created_count += created
+                skipped_count += skipped
+                if failed is not None:
+                    failed_items.append(failed)
+    else:
+        try:
+            body = _parse(resp)
+        except Exception:
+            body = resp.text
+        print(f"Batch failed: {resp.status_code} {body}")
+
+    return created_count, skipped_count, failed_items
+
+
 def main():
     # Load env (if present)
     env_path = Path(__file__).resolve().parents[1] / ".env"
@@ -150,83 +258,41 @@ def main():
     # Sanitize upfront to minimize 422s
     vendors = [_sanitize_vendor(v) for v in vendors]
 
+    # Drop repeated vendor_codes up front instead of hitting the 409 retry path
+    unique_vendors: Dict[Any, Dict[str, Any]] = {}
+    for v in vendors:
+        unique_vendors.setdefault(v.get("vendor_code"), v)
+    if len(unique_vendors) < len(vendors):
+        print(f"Skipping {len(vendors) - len(unique_vendors)} duplicate vendor_code entries in seed file")
+    vendors = list(unique_vendors.values())
+
     headers = {"Content-Type": "application/json"}
     if token:
         headers["Authorization"] = f"Bearer {token}"
 
-    session = requests.Session()
-    session.headers.update(headers)
+    # Batches are independent, so post several concurrently; each worker thread keeps its own session
+    concurrency = int(os.getenv("SEED_CONCURRENCY", "8"))
 
     created_count = 0
     skipped_count = 0
     failed_items: List[Dict[str, Any]] = []
 
-    print(f"Seeding {len(vendors)} vendors to {url} (batch_size={batch_size})")
+    print(f"Seeding {len(vendors)} vendors to {url} (batch_size={batch_size}, concurrency={concurrency})")
 
-    for batch in chunked(vendors, batch_size):
-        resp = post_batch(session, url, batch)
-        if resp.status_code in (200, 201):
-            data = resp.json()
-            # APIResponse: { success, message, data: [vendors] }
-            created = len(data.get("data") or [])
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = pool.map(lambda batch: seed_batch(url, headers, batch), chunked(vendors, batch_size))
+        for created, skipped, failed in results:
             created_count += created
-            print(f"Created {created} vendors (batch)")
-            continue
-
-        # If conflict or validation error on batch, try item-by-item
-        if resp.status_code in (409, 422):
-            print("Batch conflict detected, retrying items individually...")
-            for item in batch:
-                single = _sanitize_vendor(item)
-                r = post_batch(session, url, [single])
-                if r.status_code in (200, 201):
-                    created_count += 1
-                elif r.status_code == 409:
-                    # Try regenerating vendor_code once and retry
-                    retry_item = dict(single)
-                    retry_item["vendor_code"] = _generate_vendor_code(retry_item.get("vendor_name"))
-                    r2 = post_batch(session, url, [retry_item])
-                    if r2.status_code in (200, 201):
-                        created_count += 1
-                    else:
-                        skipped_count += 1
-                        try:
-                            detail = r2.json().get("detail")
-                        except Exception:
-                            detail = r2.text
-                        code = single.get("vendor_code")
-                        print(f"Skip duplicate vendor_code={code} after retry: {detail}")
-                elif r.status_code == 422:
-                    try:
-                        err = r.json()
-                    except Exception:
-                        err = r.text
-                    print(f"Validation failed for vendor_code={item.get('vendor_code')}: {err}")
-                    failed_items.append({
-                        "vendor_code": item.get("vendor_code"),
-                        "vendor_name": item.get("vendor_name"),
-                        "error": err,
-                        "record": item,
-                    })
-                else:
-                    try:
-                        body = r.json()
-                    except Exception:
-                        body = r.text
-                    print(f"Failed to create vendor_code={item.get('vendor_code')}: {r.status_code} {body}")
-        else:
-            try:
-                body = resp.json()
-            except Exception:
-                body = resp.text
-            print(f"Batch failed: {resp.status_code} {body}")
+            skipped_count += skipped
+            failed_items.extend(failed)
 
     print(f"Done. Created={created_count}, SkippedDuplicates={skipped_count}")
     if failed_items:
         out_path = Path(__file__).resolve().parent / "seed_failures.json"
         try:
-            with out_path.open("w", encoding="utf-8") as f:
-                json.dump(failed_items, f, ensure_ascii=False, indent=2)
+            out_path.write_bytes(
+                orjson.dumps(failed_items, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            )
             print(f"Wrote {len(failed_items)} failed items to {out_path}")
         except Exception as e:
             print(f"Could not write failure report: {e}")
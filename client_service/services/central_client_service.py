@@ -1,22 +1,88 @@
 import logging
-from typing import List
-from uuid import UUID
+import os
+from datetime import datetime, timezone
+from typing import List, Optional
+from uuid import UUID, uuid4
 
 from client_service.api.constants.messages import CentralClientMessages
 from client_service.api.constants.status_codes import StatusCode
 from client_service.schemas.base_response import APIResponse
-from client_service.schemas.client_db.client_models import CentralClients
+from client_service.schemas.client_db.client_models import CentralClients, Clients
 from client_service.schemas.pydantic_schemas import (
     CentralClientCreate,
     CentralClientResponse,
     CentralClientUpdate,
 )
+from client_service.utils.pagination import cursor_meta, paginate
+from asyncpg import PostgresError
 from fastapi import HTTPException
-from sqlalchemy import select
+from sqlalchemy import String, any_, bindparam, column, delete, exists, insert, select, update, values
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 logger = logging.getLogger(__name__)
 
+# Response fields, selected as plain columns so rows skip ORM hydration and re-validation
+_RESPONSE_FIELDS = tuple(CentralClientResponse.model_fields)
+_TABLE = CentralClients.__table__
+_RESPONSE_COLUMNS = tuple(getattr(CentralClients, field) for field in _RESPONSE_FIELDS)
+
+# PostgreSQL SQLSTATE for unique_violation
+UNIQUE_VIOLATION = "23505"
+
+# Statements built once at import; per-call values are bound by parameter name
+_GET_BY_ID = select(*_RESPONSE_COLUMNS).where(
+    CentralClients.central_client_id == bindparam("client_id")
+)
+# Names travel as one array parameter, not one bound parameter per name
+_EXISTING_NAMES = select(CentralClients.name).where(
+    CentralClients.name == any_(bindparam("names", type_=ARRAY(String)))
+)
+# Detach linked clients, as the ORM relationship did, in a CTE of the DELETE
+# so both run in one round trip; foreign keys are checked at statement end
+_DELETE_BY_ID = (
+    delete(CentralClients)
+    .where(CentralClients.central_client_id == bindparam("client_id"))
+    .returning(CentralClients.central_client_id)
+    .add_cte(
+        update(Clients)
+        .where(Clients.central_client_id == bindparam("client_id"))
+        .values(central_client_id=None)
+        .cte("detached_clients")
+    )
+)
+
+# Batches larger than this are written with COPY instead of INSERT
+COPY_THRESHOLD = int(os.getenv("CENTRAL_CLIENT_COPY_THRESHOLD", 100))
+
+
+def _new_records(central_client_data: List[CentralClientCreate]) -> List[dict]:
+    """
+    Build complete rows for new central clients.
+    Ids and timestamps are generated here because COPY and INSERT ... SELECT
+    bypass the ORM column defaults.
+    """
+    now = datetime.now(timezone.utc)
+    return [
+        {
+            "name": central_client.name,
+            "central_client_id": uuid4(),
+            "created_at": now,
+            "updated_at": now,
+        }
+        for central_client in central_client_data
+    ]
+
+
+def _is_unique_violation(error: Exception) -> bool:
+    """True for PostgreSQL unique violations, raised raw by asyncpg or wrapped by SQLAlchemy"""
+    orig = getattr(error, "orig", None)
+    return UNIQUE_VIOLATION in (
+        getattr(error, "sqlstate", None),
+        getattr(orig, "sqlstate", None),
+    )
+
 
 class CentralClientService:
     """Service class for Central Client business logic"""
@@ -35,106 +101,136 @@ class CentralClientService:
                 )
 
             logger.info(
-                f"Processing creation of {len(central_client_data)} central client(s)"
+                "Processing creation of %d central client(s)", len(central_client_data)
             )
 
             # Validation Phase 2: Collect all central client names for batch duplicate check
-            batch_names = {}  # {name: index}
-            for idx, central_client in enumerate(central_client_data):
-                if central_client.name in batch_names:
-                    logger.warning(f"Duplicate name in batch: {central_client.name}")
-                    raise HTTPException(
-                        status_code=StatusCode.CONFLICT,
-                        detail=f"Duplicate central client name in batch: {central_client.name} (also at position {batch_names[central_client.name]})",
-                    )
-                else:
-                    batch_names[central_client.name] = idx
-
-            # Validation Phase 3: Check for duplicates in existing database
-            existing_result = await db.execute(
-                select(CentralClients).where(
-                    CentralClients.name.in_(batch_names.keys())
+            names = [central_client.name for central_client in central_client_data]
+            # {name: first index}, built in C; only walk the batch again if sizes differ
+            batch_names = dict(zip(reversed(names), range(len(names) - 1, -1, -1)))
+            if len(batch_names) != len(names):
+                for idx, name in enumerate(names):
+                    if batch_names[name] != idx:
+                        logger.warning(f"Duplicate name in batch: {name}")
+                        raise HTTPException(
+                            status_code=StatusCode.CONFLICT,
+                            detail=f"Duplicate central client name in batch: {name} (also at position {batch_names[name]})",
+                        )
+
+            # Validation Phase 3: Build insert records for all new central clients
+            new_records = _new_records(central_client_data)
+
+            if len(new_records) > COPY_THRESHOLD:
+                # COPY cannot skip conflicts, so check for existing names first
+                existing_result = await db.execute(
+                    _EXISTING_NAMES, {"names": list(batch_names)}
                 )
-            )
-            existing_central_clients = existing_result.scalars().all()
-
-            if existing_central_clients:
-                existing_names = [c.name for c in existing_central_clients]
-                logger.warning(f"Central clients already exist in DB: {existing_names}")
-                raise HTTPException(
-                    status_code=StatusCode.CONFLICT,
-                    detail=f"The following central client names already exist: {', '.join(existing_names)}",
+                existing_names = existing_result.scalars().all()
+                if existing_names:
+                    CentralClientService._raise_existing(existing_names)
+
+                # Large batches stream through COPY instead of a multi-row INSERT
+                await CentralClientService._copy_insert(new_records, db)
+                created_central_clients = new_records
+            else:
+                # Insert only names not already stored, in one INSERT ... SELECT ... RETURNING
+                created_central_clients = await CentralClientService._insert_missing(
+                    new_records, db
                 )
-
-            # Validation Phase 4: Create all new central client records
-            new_central_clients = []
-            for central_client_data in central_client_data:
-                try:
-                    # Create new central client instance (UUID will be auto-generated)
-                    new_central_client = CentralClients(
-                        **central_client_data.model_dump(exclude_unset=True)
+                if len(created_central_clients) < len(new_records):
+                    created_names = {c["name"] for c in created_central_clients}
+                    CentralClientService._raise_existing(
+                        [name for name in names if name not in created_names]
                     )
-                    new_central_clients.append(new_central_client)
-
-                except Exception as e:
-                    logger.error(
-                        f"Error preparing central client {central_client_data.name}: {str(e)}"
-                    )
-                    raise HTTPException(
-                        status_code=StatusCode.BAD_REQUEST,
-                        detail=f"Error preparing central client {central_client_data.name}: {str(e)}",
-                    )
-
-            # Commit Phase: Add all to session and commit atomically
-            for new_central_client in new_central_clients:
-                db.add(new_central_client)
+                created_central_clients.sort(key=lambda c: batch_names[c["name"]])
 
+            # Commit Phase: commit all new central clients atomically
             await db.commit()
 
-            # Refresh all central clients to get generated IDs
-            for new_central_client in new_central_clients:
-                await db.refresh(new_central_client)
-                created_central_clients.append(
-                    CentralClientResponse.model_validate(
-                        new_central_client
-                    ).model_dump()
-                )
-
             # Success logging and response
-            logger.info(
-                f"Successfully created {len(created_central_clients)} central client(s)"
-            )
+            message = f"Successfully created {len(created_central_clients)} central client(s)"
+            logger.info(message)
 
-            return APIResponse(
+            return APIResponse.model_construct(
                 success=True,
-                message=f"Successfully created {len(created_central_clients)} central client(s)",
+                message=message,
                 data=created_central_clients,
             )
 
         except HTTPException:
             await db.rollback()
             raise
-        except Exception as e:
+        except (SQLAlchemyError, PostgresError) as e:
             await db.rollback()
+            # The unique index on name catches inserts that raced this request
+            if _is_unique_violation(e):
+                logger.warning(f"Central client name conflict on insert: {e}")
+                raise HTTPException(
+                    status_code=StatusCode.CONFLICT,
+                    detail="One or more central client names already exist",
+                )
             logger.error(CentralClientMessages.CREATE_ERROR.format(error=str(e)))
             raise HTTPException(
                 status_code=StatusCode.BAD_REQUEST,
                 detail=CentralClientMessages.CREATE_ERROR.format(error=str(e)),
             )
 
+    @staticmethod
+    def _raise_existing(existing_names: List[str]):
+        """Reject the batch because some central client names are already stored"""
+        logger.warning(f"Central clients already exist in DB: {existing_names}")
+        raise HTTPException(
+            status_code=StatusCode.CONFLICT,
+            detail=f"The following central client names already exist: {', '.join(existing_names)}",
+        )
+
+    @staticmethod
+    async def _insert_missing(new_records: List[dict], db: AsyncSession) -> List[dict]:
+        """
+        Insert the records whose name is not stored yet, skipping the rest.
+        Returns the inserted rows; the existence check and insert share one round trip.
+        """
+        incoming = values(
+            *(column(field, _TABLE.c[field].type) for field in _RESPONSE_FIELDS),
+            name="incoming",
+        ).data([tuple(record[field] for field in _RESPONSE_FIELDS) for record in new_records])
+
+        result = await db.execute(
+            insert(CentralClients)
+            .from_select(
+                list(_RESPONSE_FIELDS),
+                select(incoming).where(
+                    ~exists().where(CentralClients.name == incoming.c.name)
+                ),
+            )
+            .returning(*_RESPONSE_COLUMNS)
+        )
+        return [dict(row) for row in result.mappings()]
+
+    @staticmethod
+    async def _copy_insert(new_records: List[dict], db: AsyncSession):
+        """Insert central clients with PostgreSQL COPY on the session's connection"""
+        connection = await db.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            CentralClients.__tablename__,
+            records=[
+                tuple(record[field] for field in _RESPONSE_FIELDS)
+                for record in new_records
+            ],
+            columns=list(_RESPONSE_FIELDS),
+        )
+
     @staticmethod
     async def get_by_id(client_id: UUID, db: AsyncSession):
         """Get a central client by ID"""
         try:
-            result = await db.execute(
-                select(CentralClients).where(
-                    CentralClients.central_client_id == client_id
-                )
-            )
-            central_client = result.scalar_one_or_none()
+            # Project the response columns only, no ORM instance is needed for a read
+            result = await db.execute(_GET_BY_ID, {"client_id": client_id})
+            central_client = result.mappings().one_or_none()
 
             if not central_client:
-                return APIResponse(
+                return APIResponse.model_construct(
                     success=True,
                     message=CentralClientMessages.RETRIEVED_SUCCESS.format(
                         name=client_id
@@ -146,20 +242,19 @@ class CentralClientService:
             #     detail=CentralClientMessages.NOT_FOUND.format(id=client_id)
             # )
 
-            logger.info(
-                CentralClientMessages.RETRIEVED_SUCCESS.format(name=central_client.name)
+            message = CentralClientMessages.RETRIEVED_SUCCESS.format(
+                name=central_client["name"]
             )
-            return APIResponse(
+            logger.info(message)
+            return APIResponse.model_construct(
                 success=True,
-                message=CentralClientMessages.RETRIEVED_SUCCESS.format(
-                    name=central_client.name
-                ),
-                data=CentralClientResponse.model_validate(central_client).model_dump(),
+                message=message,
+                data=dict(central_client),
             )
 
         except HTTPException:
             raise
-        except Exception as e:
+        except SQLAlchemyError as e:
             logger.error(CentralClientMessages.RETRIEVE_ERROR.format(error=str(e)))
             raise HTTPException(
                 status_code=StatusCode.BAD_REQUEST,
@@ -167,29 +262,35 @@ class CentralClientService:
             )
 
     @staticmethod
-    async def get_all(skip: int, limit: int, db: AsyncSession):
+    async def get_all(
+        skip: int, limit: int, db: AsyncSession, after: Optional[UUID] = None
+    ):
         """Get all central clients with pagination"""
         try:
-            result = await db.execute(select(CentralClients).offset(skip).limit(limit))
-            central_clients = result.scalars().all()
-
-            logger.info(
-                CentralClientMessages.RETRIEVED_ALL_SUCCESS.format(
-                    count=len(central_clients)
+            # Select only the response columns so rows skip ORM hydration
+            result = await db.execute(
+                paginate(
+                    select(*_RESPONSE_COLUMNS),
+                    CentralClients.central_client_id,
+                    skip,
+                    limit,
+                    after,
                 )
             )
-            return APIResponse(
+            central_clients = result.all()
+
+            message = CentralClientMessages.RETRIEVED_ALL_SUCCESS.format(
+                count=len(central_clients)
+            )
+            logger.info(message)
+            return APIResponse.model_construct(
                 success=True,
-                message=CentralClientMessages.RETRIEVED_ALL_SUCCESS.format(
-                    count=len(central_clients)
-                ),
-                data=[
-                    CentralClientResponse.model_validate(client).model_dump()
-                    for client in central_clients
-                ],
+                message=message,
+                data=[dict(client._mapping) for client in central_clients],
+                meta=cursor_meta(central_clients, "central_client_id", limit),
             )
 
-        except Exception as e:
+        except SQLAlchemyError as e:
             logger.error(CentralClientMessages.RETRIEVE_ALL_ERROR.format(error=str(e)))
             raise HTTPException(
                 status_code=StatusCode.BAD_REQUEST,
@@ -202,12 +303,19 @@ class CentralClientService:
     ):
         """Update a central client"""
         try:
-            result = await db.execute(
-                select(CentralClients).where(
-                    CentralClients.central_client_id == client_id
+            changes = central_client_data.model_dump(exclude_unset=True)
+
+            # Apply the changes and read back the response columns in one statement
+            if changes:
+                result = await db.execute(
+                    update(CentralClients)
+                    .where(CentralClients.central_client_id == client_id)
+                    .values(**changes)
+                    .returning(*_RESPONSE_COLUMNS)
                 )
-            )
-            central_client = result.scalar_one_or_none()
+            else:
+                result = await db.execute(_GET_BY_ID, {"client_id": client_id})
+            central_client = result.mappings().one_or_none()
 
             if not central_client:
                 raise HTTPException(
@@ -215,29 +323,21 @@ class CentralClientService:
                     detail=CentralClientMessages.NOT_FOUND.format(id=client_id),
                 )
 
-            # Update fields
-            for key, value in central_client_data.model_dump(
-                exclude_unset=True
-            ).items():
-                setattr(central_client, key, value)
-
             await db.commit()
-            await db.refresh(central_client)
 
-            logger.info(
-                CentralClientMessages.UPDATED_SUCCESS.format(name=central_client.name)
+            message = CentralClientMessages.UPDATED_SUCCESS.format(
+                name=central_client["name"]
             )
-            return APIResponse(
+            logger.info(message)
+            return APIResponse.model_construct(
                 success=True,
-                message=CentralClientMessages.UPDATED_SUCCESS.format(
-                    name=central_client.name
-                ),
-                data=CentralClientResponse.model_validate(central_client).model_dump(),
+                message=message,
+                data=dict(central_client),
             )
 
         except HTTPException:
             raise
-        except Exception as e:
+        except SQLAlchemyError as e:
             await db.rollback()
             logger.error(CentralClientMessages.UPDATE_ERROR.format(error=str(e)))
             raise HTTPException(
@@ -249,32 +349,27 @@ class CentralClientService:
     async def delete(client_id: UUID, db: AsyncSession):
         """Delete a central client"""
         try:
-            result = await db.execute(
-                select(CentralClients).where(
-                    CentralClients.central_client_id == client_id
-                )
-            )
-            central_client = result.scalar_one_or_none()
+            result = await db.execute(_DELETE_BY_ID, {"client_id": client_id})
 
-            if not central_client:
+            if result.scalar_one_or_none() is None:
                 raise HTTPException(
                     status_code=StatusCode.NOT_FOUND,
                     detail=CentralClientMessages.NOT_FOUND.format(id=client_id),
                 )
 
-            await db.delete(central_client)
             await db.commit()
 
-            logger.info(CentralClientMessages.DELETED_SUCCESS.format(id=client_id))
-            return APIResponse(
+            message = CentralClientMessages.DELETED_SUCCESS.format(id=client_id)
+            logger.info(message)
+            return APIResponse.model_construct(
                 success=True,
-                message=CentralClientMessages.DELETED_SUCCESS.format(id=client_id),
+                message=message,
                 data=None,
             )
 
         except HTTPException:
             raise
-        except Exception as e:
+        except SQLAlchemyError as e:
             await db.rollback()
             logger.error(CentralClientMessages.DELETE_ERROR.format(error=str(e)))
             raise HTTPException(
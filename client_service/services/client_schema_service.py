@@ -4,17 +4,19 @@ from typing import List, Optional
 from uuid import UUID
 
 from beanie import PydanticObjectId
+from beanie.operators import Set
 from client_service.api.constants.messages import ClientSchemaMessages
 from client_service.api.constants.status_codes import StatusCode
 from client_service.schemas.base_response import APIResponse
 from client_service.schemas.client_db.client_models import Clients
 from client_service.schemas.mongo_schemas.client_schema_model import (
     ClientSchema,
+    ClientSchemaProjection,
+    ClientSchemaVersion,
     SchemaField,
 )
 from client_service.schemas.pydantic_schemas import (
     ClientSchemaCreate,
-    ClientSchemaResponse,
     ClientSchemaUpdate,
     SchemaFieldCreate,
 )
@@ -25,9 +27,50 @@ from sqlalchemy.ext.asyncio import AsyncSession
 logger = logging.getLogger(__name__)
 
 
+def _to_response_dict(schema: ClientSchema) -> dict:
+    """Build the ClientSchemaResponse dict directly, stored documents need no re-validation"""
+    return {
+        "_id": str(schema.id),
+        "client_id": schema.client_id,
+        "schema_name": schema.schema_name,
+        "version": schema.version,
+        "is_active": schema.is_active,
+        "description": schema.description,
+        "fields": [field.model_dump() for field in schema.fields],
+        "created_by": schema.created_by,
+        "updated_by": schema.updated_by,
+        "created_at": schema.created_at,
+        "updated_at": schema.updated_at,
+    }
+
+
 class ClientSchemaService:
     """Service class for Client Schema business logic"""
 
+    @staticmethod
+    async def _deactivate_versions(
+        client_id: str,
+        schema_name: str,
+        exclude_id: Optional[PydanticObjectId] = None,
+    ):
+        """Deactivate every active version of a schema in one update_many"""
+        query = ClientSchema.find(
+            ClientSchema.client_id == client_id,
+            ClientSchema.schema_name == schema_name,
+            ClientSchema.is_active == True,
+        )
+        if exclude_id is not None:
+            query = query.find(ClientSchema.id != exclude_id)
+
+        await query.update_many(
+            Set(
+                {
+                    ClientSchema.is_active: False,
+                    ClientSchema.updated_at: datetime.now(timezone.utc),
+                }
+            )
+        )
+
     @staticmethod
     async def create(
         schema_data: List[ClientSchemaCreate], db: AsyncSession
@@ -50,10 +93,11 @@ class ClientSchemaService:
 
             logger.info(f"Processing creation of {len(schema_data)} client schema(s)")
 
-            # Validation Phase 2: Validate all client_id formats
+            # Validation Phase 2: Validate all client_id formats, parsing each once
+            parsed_client_ids = []
             for idx, schema_item in enumerate(schema_data):
                 try:
-                    UUID(schema_item.client_id)
+                    parsed_client_ids.append(UUID(schema_item.client_id))
                 except ValueError:
                     logger.warning(
                         f"Invalid client_id format at position {idx}: {schema_item.client_id}"
@@ -64,7 +108,7 @@ class ClientSchemaService:
                     )
 
             # Validation Phase 3: Collect all unique client IDs
-            unique_client_ids = {UUID(schema.client_id) for schema in schema_data}
+            unique_client_ids = set(parsed_client_ids)
 
             # Validation Phase 4: Verify all clients exist in PostgreSQL
             # clients_result = await db.execute(
@@ -98,28 +142,41 @@ class ClientSchemaService:
 
                 batch_schemas[schema_item.client_id][schema_item.schema_name] = idx
 
+            # Fetch existing versions for every (client_id, schema_name) in one query
+            existing_rows = (
+                await ClientSchema.find(
+                    {
+                        "$or": [
+                            {"client_id": item.client_id, "schema_name": item.schema_name}
+                            for item in schema_data
+                        ]
+                    }
+                )
+                .project(ClientSchemaVersion)
+                .to_list()
+            )
+            existing_versions = {}  # {(client_id, schema_name): {version, ...}}
+            for row in existing_rows:
+                existing_versions.setdefault(
+                    (row.client_id, row.schema_name), set()
+                ).add(row.version)
+
             # Validation Phase 6: Process each schema
+            now = datetime.now(timezone.utc)
             new_schemas = []
+            deactivate_filters = []
             for schema_item in schema_data:
                 try:
-                    # Check if schema with same name exists for this client
-                    existing_schemas = (
-                        await ClientSchema.find(
-                            ClientSchema.client_id == schema_item.client_id,
-                            ClientSchema.schema_name == schema_item.schema_name,
-                        )
-                        .sort(-ClientSchema.version)
-                        .to_list()
+                    # Versions already stored for this client's schema name
+                    versions = existing_versions.get(
+                        (schema_item.client_id, schema_item.schema_name), set()
                     )
 
                     # Determine version number
                     if schema_item.version:
                         version = schema_item.version
                         # Check if this version already exists
-                        version_exists = any(
-                            s.version == version for s in existing_schemas
-                        )
-                        if version_exists:
+                        if version in versions:
                             logger.warning(
                                 f"Schema version already exists: {schema_item.schema_name} v{version}"
                             )
@@ -133,17 +190,16 @@ class ClientSchemaService:
                             )
                     else:
                         # Auto-generate version (max + 1)
-                        version = (
-                            max([s.version for s in existing_schemas], default=0) + 1
-                        )
+                        version = max(versions, default=0) + 1
 
                     # If this version should be active, deactivate all other versions
                     if schema_item.is_active:
-                        for schema in existing_schemas:
-                            if schema.is_active:
-                                schema.is_active = False
-                                schema.updated_at = datetime.now(timezone.utc)
-                                await schema.save()
+                        deactivate_filters.append(
+                            {
+                                "client_id": schema_item.client_id,
+                                "schema_name": schema_item.schema_name,
+                            }
+                        )
 
                     # Convert SchemaFieldCreate to dict (not SchemaField objects)
                     fields = [field.model_dump() for field in schema_item.fields]
@@ -158,8 +214,8 @@ class ClientSchemaService:
                         fields=fields,
                         created_by=schema_item.created_by,
                         updated_by=schema_item.created_by,
-                        created_at=datetime.now(timezone.utc),
-                        updated_at=datetime.now(timezone.utc),
+                        created_at=now,
+                        updated_at=now,
                     )
 
                     new_schemas.append(new_schema)
@@ -175,27 +231,24 @@ class ClientSchemaService:
                         detail=f"Error preparing schema {schema_item.schema_name}: {str(e)}",
                     )
 
-            # Commit Phase: Insert all schemas
-            for new_schema in new_schemas:
-                await new_schema.insert()
+            # Commit Phase: Deactivate prior versions for the whole batch in one update
+            if deactivate_filters:
+                await ClientSchema.find(
+                    {"$or": deactivate_filters}, ClientSchema.is_active == True
+                ).update_many(
+                    Set({ClientSchema.is_active: False, ClientSchema.updated_at: now})
+                )
+
+            # Insert all schemas in one unordered bulk write
+            if new_schemas:
+                result = await ClientSchema.insert_many(new_schemas, ordered=False)
+                # insert_many does not set ids on the documents, copy them back for the response
+                for new_schema, inserted_id in zip(new_schemas, result.inserted_ids):
+                    new_schema.id = inserted_id
 
             # Build response with created schemas
             for new_schema in new_schemas:
-                created_schemas.append(
-                    ClientSchemaResponse(
-                        _id=str(new_schema.id),
-                        client_id=new_schema.client_id,
-                        schema_name=new_schema.schema_name,
-                        version=new_schema.version,
-                        is_active=new_schema.is_active,
-                        description=new_schema.description,
-                        fields=new_schema.fields,
-                        created_by=new_schema.created_by,
-                        updated_by=new_schema.updated_by,
-                        created_at=new_schema.created_at,
-                        updated_at=new_schema.updated_at,
-                    ).model_dump(by_alias=True)
-                )
+                created_schemas.append(_to_response_dict(new_schema))
 
             # Success logging and response
             logger.info(f"Successfully created {len(created_schemas)} client schema(s)")
@@ -238,19 +291,7 @@ class ClientSchemaService:
                 message=ClientSchemaMessages.RETRIEVED_SUCCESS.format(
                     name=schema.schema_name, version=schema.version
                 ),
-                data=ClientSchemaResponse(
-                    _id=str(schema.id),
-                    client_id=schema.client_id,
-                    schema_name=schema.schema_name,
-                    version=schema.version,
-                    is_active=schema.is_active,
-                    description=schema.description,
-                    fields=schema.fields,
-                    created_by=schema.created_by,
-                    updated_by=schema.updated_by,
-                    created_at=schema.created_at,
-                    updated_at=schema.updated_at,
-                ).model_dump(by_alias=True),
+                data=_to_response_dict(schema),
             )
 
         except HTTPException:
@@ -266,7 +307,13 @@ class ClientSchemaService:
     async def get_all(skip: int = 0, limit: int = 100):
         """Get all client schemas with pagination"""
         try:
-            schemas = await ClientSchema.find_all().skip(skip).limit(limit).to_list()
+            schemas = (
+                await ClientSchema.find_all()
+                .project(ClientSchemaProjection)
+                .skip(skip)
+                .limit(limit)
+                .to_list()
+            )
 
             logger.info(
                 ClientSchemaMessages.RETRIEVED_ALL_SUCCESS.format(count=len(schemas))
@@ -277,20 +324,7 @@ class ClientSchemaService:
                 message=ClientSchemaMessages.RETRIEVED_ALL_SUCCESS.format(
                     count=len(schemas)
                 ),
-                data=[
-                    ClientSchemaResponse(
-                        _id=str(schema.id),
-                        client_id=schema.client_id,
-                        schema_name=schema.schema_name,
-                        version=schema.version,
-                        is_active=schema.is_active,
-                        description=schema.description,
-                        fields=schema.fields,
-                        created_at=schema.created_at,
-                        updated_at=schema.updated_at,
-                    ).model_dump(by_alias=True)
-                    for schema in schemas
-                ],
+                data=[schema.model_dump(by_alias=True) for schema in schemas],
             )
 
         except Exception as e:
@@ -304,9 +338,11 @@ class ClientSchemaService:
     async def get_by_client_id(client_id: str):
         """Get all schemas for a specific client"""
         try:
-            schemas = await ClientSchema.find(
-                ClientSchema.client_id == client_id
-            ).to_list()
+            schemas = (
+                await ClientSchema.find(ClientSchema.client_id == client_id)
+                .project(ClientSchemaProjection)
+                .to_list()
+            )
 
             if not schemas:
                 logger.info(
@@ -331,20 +367,7 @@ class ClientSchemaService:
                 message=ClientSchemaMessages.RETRIEVED_BY_CLIENT_SUCCESS.format(
                     count=len(schemas), id=client_id
                 ),
-                data=[
-                    ClientSchemaResponse(
-                        _id=str(schema.id),
-                        client_id=schema.client_id,
-                        schema_name=schema.schema_name,
-                        version=schema.version,
-                        is_active=schema.is_active,
-                        description=schema.description,
-                        fields=schema.fields,
-                        created_at=schema.created_at,
-                        updated_at=schema.updated_at,
-                    ).model_dump(by_alias=True)
-                    for schema in schemas
-                ],
+                data=[schema.model_dump(by_alias=True) for schema in schemas],
             )
 
         except Exception as e:
@@ -364,6 +387,7 @@ class ClientSchemaService:
                     ClientSchema.schema_name == schema_name,
                 )
                 .sort(-ClientSchema.version)
+                .project(ClientSchemaProjection)
                 .to_list()
             )
 
@@ -386,20 +410,7 @@ class ClientSchemaService:
                 message=ClientSchemaMessages.RETRIEVED_BY_CLIENT_SUCCESS.format(
                     count=len(schemas), id=client_id
                 ),
-                data=[
-                    ClientSchemaResponse(
-                        _id=str(schema.id),
-                        client_id=schema.client_id,
-                        schema_name=schema.schema_name,
-                        version=schema.version,
-                        is_active=schema.is_active,
-                        description=schema.description,
-                        fields=schema.fields,
-                        created_at=schema.created_at,
-                        updated_at=schema.updated_at,
-                    ).model_dump(by_alias=True)
-                    for schema in schemas
-                ],
+                data=[schema.model_dump(by_alias=True) for schema in schemas],
             )
 
         except HTTPException:
@@ -440,19 +451,7 @@ class ClientSchemaService:
                 message=ClientSchemaMessages.RETRIEVED_ACTIVE_SUCCESS.format(
                     name=schema.schema_name, version=schema.version
                 ),
-                data=ClientSchemaResponse(
-                    _id=str(schema.id),
-                    client_id=schema.client_id,
-                    schema_name=schema.schema_name,
-                    version=schema.version,
-                    is_active=schema.is_active,
-                    description=schema.description,
-                    fields=schema.fields,
-                    created_by=schema.created_by,
-                    updated_by=schema.updated_by,
-                    created_at=schema.created_at,
-                    updated_at=schema.updated_at,
-                ).model_dump(by_alias=True),
+                data=_to_response_dict(schema),
             )
 
         except HTTPException:
@@ -493,17 +492,9 @@ class ClientSchemaService:
             ):
                 if schema_data.is_active:
                     # Deactivate all other versions
-                    other_schemas = await ClientSchema.find(
-                        ClientSchema.client_id == schema.client_id,
-                        ClientSchema.schema_name == schema.schema_name,
-                        ClientSchema.id != schema.id,
-                    ).to_list()
-
-                    for other in other_schemas:
-                        if other.is_active:
-                            other.is_active = False
-                            other.updated_at = datetime.now(timezone.utc)
-                            await other.save()
+                    await ClientSchemaService._deactivate_versions(
+                        schema.client_id, schema.schema_name, exclude_id=schema.id
+                    )
 
                 schema.is_active = schema_data.is_active
             if schema_data.updated_by:
@@ -522,19 +513,7 @@ class ClientSchemaService:
                 message=ClientSchemaMessages.UPDATED_SUCCESS.format(
                     name=schema.schema_name, version=schema.version
                 ),
-                data=ClientSchemaResponse(
-                    _id=str(schema.id),
-                    client_id=schema.client_id,
-                    schema_name=schema.schema_name,
-                    version=schema.version,
-                    is_active=schema.is_active,
-                    description=schema.description,
-                    fields=schema.fields,
-                    created_by=schema.created_by,
-                    updated_by=schema.updated_by,
-                    created_at=schema.created_at,
-                    updated_at=schema.updated_at,
-                ).model_dump(by_alias=True),
+                data=_to_response_dict(schema),
             )
 
         except HTTPException:
@@ -562,17 +541,9 @@ class ClientSchemaService:
                 )
 
             # Deactivate all other versions
-            other_schemas = await ClientSchema.find(
-                ClientSchema.client_id == schema.client_id,
-                ClientSchema.schema_name == schema.schema_name,
-                ClientSchema.id != schema.id,
-            ).to_list()
-
-            for other in other_schemas:
-                if other.is_active:
-                    other.is_active = False
-                    other.updated_at = datetime.now(timezone.utc)
-                    await other.save()
+            await ClientSchemaService._deactivate_versions(
+                schema.client_id, schema.schema_name, exclude_id=schema.id
+            )
 
             # Activate this version
             schema.is_active = True
@@ -590,19 +561,7 @@ class ClientSchemaService:
                 message=ClientSchemaMessages.ACTIVATED_SUCCESS.format(
                     name=schema.schema_name, version=schema.version
                 ),
-                data=ClientSchemaResponse(
-                    _id=str(schema.id),
-                    client_id=schema.client_id,
-                    schema_name=schema.schema_name,
-                    version=schema.version,
-                    is_active=schema.is_active,
-                    description=schema.description,
-                    fields=schema.fields,
-                    created_by=schema.created_by,
-                    updated_by=schema.updated_by,
-                    created_at=schema.created_at,
-                    updated_at=schema.updated_at,
-                ).model_dump(by_alias=True),
+                data=_to_response_dict(schema),
             )
 
         except HTTPException:
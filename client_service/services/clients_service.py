@@ -68,16 +68,16 @@ class ClientService:
             
             # Validation Phase 4: Create all new client records
             new_clients = []
-            for client_data in client_data:
+            for item in client_data:
                 try:
                     # Create new client instance (UUID will be auto-generated)
-                    new_client = Clients(**client_data.model_dump(exclude_unset=True))
+                    new_client = Clients(**item.model_dump(exclude_unset=True))
                     new_clients.append(new_client)
                     
                 except Exception as e:
-                    logger.error(f"Error preparing client {client_data.client_name}: {str(e)}")
+                    logger.error(f"Error preparing client {item.client_name}: {str(e)}")
                     failed_clients.append({
-                        "client_name": client_data.client_name,
+                        "client_name": item.client_name,
                         "error": f"Error preparing client: {str(e)}"
                     })
             
@@ -4,11 +4,14 @@ from typing import Any, Dict, List, Optional
 from uuid import UUID
 
 from bson import ObjectId
+from bson.errors import InvalidId
 from client_service.api.constants.status_codes import StatusCode
 from client_service.schemas.base_response import APIResponse
 from client_service.schemas.client_db.client_models import Clients
 from client_service.schemas.client_db.vendor_models import VendorMaster
+from client_service.db.mongo_db import get_mongo_db
 from client_service.schemas.mongo_schemas.client_schema_model import ClientSchema
+from client_service.schemas.pydantic_schemas import DocumentCreate
 from rapidfuzz import fuzz
 from client_service.schemas.mongo_schemas.dynamic_document_model import (
     get_or_create_collection_config,
@@ -29,16 +32,8 @@ class DocumentService:
     """Service for managing dynamic documents based on client schemas"""
 
     @staticmethod
-    async def _validate_client(client_id: str, db: AsyncSession) -> bool:
+    async def _validate_client(client_id: UUID, db: AsyncSession) -> bool:
         """Validate that client exists in PostgreSQL"""
-        try:
-            UUID(client_id)
-        except ValueError:
-            raise HTTPException(
-                status_code=StatusCode.BAD_REQUEST,
-                detail=f"Invalid client_id format: {client_id}",
-            )
-
         result = await db.execute(select(Clients).where(Clients.client_id == client_id))
         client = result.scalar_one_or_none()
 
@@ -130,34 +125,43 @@ class DocumentService:
             # Create indexes based on schema
             await create_indexes_for_schema(config.collection, fields_as_dicts)
 
-            # Prepare and insert documents
-            created_docs = []
+            # Validate and prepare every document before inserting any,
+            # sharing one timestamp across the batch
+            now = datetime.now(timezone.utc)
+            prepared = []
             for data in documents:
                 # Validate against schema
                 await validate_document_against_config(data, config)
 
                 # Prepare document with base fields
-                doc_to_insert = prepare_document_for_insert(
-                    data=data,
-                    client_id=client_id,
-                    created_by=created_by,
-                    updated_by=created_by,
+                prepared.append(
+                    prepare_document_for_insert(
+                        data=data,
+                        client_id=client_id,
+                        created_by=created_by,
+                        updated_by=created_by,
+                        now=now,
+                    )
                 )
 
-                # Insert using Motor
-                result = await config.collection.insert_one(doc_to_insert)
+            # Insert the whole batch in one round trip using Motor
+            inserted_ids = []
+            if prepared:
+                result = await config.collection.insert_many(prepared, ordered=False)
+                inserted_ids = result.inserted_ids
 
-                # Prepare response
-                created_doc = {
-                    "id": str(result.inserted_id),
+            # Prepare response
+            created_docs = [
+                {
+                    "id": str(inserted_id),
                     "collection": collection_name,
                     "client_id": client_id,
                     "data": data,
-                    "created_at": doc_to_insert["created_at"].isoformat(),
+                    "created_at": now.isoformat(),
                     "created_by": created_by,
                 }
-
-                created_docs.append(created_doc)
+                for data, inserted_id in zip(documents, inserted_ids)
+            ]
 
             logger.info(f"Created {len(created_docs)} documents in {collection_name}")
 
@@ -182,11 +186,118 @@ class DocumentService:
                 detail=f"Error creating document: {str(e)}",
             )
 
+    @staticmethod
+    async def bulk_create(
+        document_data: List[DocumentCreate], db: AsyncSession
+    ) -> APIResponse:
+        """
+        Create documents from several create requests in one call.
+        Requests are grouped by (client_id, collection_name) so each group
+        needs a single schema lookup and a single insert_many.
+        """
+        try:
+            groups: Dict[tuple, List[DocumentCreate]] = {}
+            for item in document_data:
+                groups.setdefault((item.client_id, item.collection_name), []).append(item)
+
+            created_docs = []
+            now = datetime.now(timezone.utc)
+            for (client_id, collection_name), items in groups.items():
+                # Get active schema once per group
+                schema = await DocumentService._get_active_schema(
+                    client_id, collection_name
+                )
+
+                fields_as_dicts = [
+                    {
+                        "name": field.name,
+                        "type": field.type,
+                        "required": field.required,
+                        "unique": field.unique,
+                        "default": field.default,
+                        "allowed_values": field.allowed_values,
+                        "ref_schema": field.ref_schema,
+                        "description": field.description,
+                    }
+                    for field in schema.fields
+                ]
+
+                config = await get_or_create_collection_config(
+                    schema_name=collection_name,
+                    fields=fields_as_dicts,
+                    client_id=client_id,
+                )
+
+                await create_indexes_for_schema(config.collection, fields_as_dicts)
+
+                # Validate every document in the group before inserting any
+                prepared = []
+                for item in items:
+                    for data in item.data:
+                        await validate_document_against_config(data, config)
+                        prepared.append(
+                            (
+                                item,
+                                data,
+                                prepare_document_for_insert(
+                                    data=data,
+                                    client_id=client_id,
+                                    created_by=item.created_by,
+                                    updated_by=item.created_by,
+                                    now=now,
+                                ),
+                            )
+                        )
+
+                # Insert the whole group in one round trip
+                result = await config.collection.insert_many(
+                    [doc for _, _, doc in prepared], ordered=False
+                )
+
+                for (item, data, doc), inserted_id in zip(prepared, result.inserted_ids):
+                    created_docs.append(
+                        {
+                            "id": str(inserted_id),
+                            "collection": collection_name,
+                            "client_id": client_id,
+                            "data": data,
+                            "created_at": doc["created_at"].isoformat(),
+                            "created_by": item.created_by,
+                        }
+                    )
+
+            logger.info(
+                f"Bulk created {len(created_docs)} documents across {len(groups)} collection(s)"
+            )
+
+            return APIResponse(
+                success=True,
+                message=f"Successfully created {len(created_docs)} documents",
+                data=created_docs,
+            )
+
+        except ValueError as ve:
+            # Validation errors
+            raise HTTPException(
+                status_code=StatusCode.UNPROCESSABLE_ENTITY,
+                detail=str(ve),
+            )
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.error(f"Error bulk creating documents: {str(e)}", exc_info=True)
+            raise HTTPException(
+                status_code=StatusCode.BAD_REQUEST,
+                detail=f"Error bulk creating documents: {str(e)}",
+            )
+
     @staticmethod
     async def get_by_id(
-        client_id: str, collection_name: str, document_id: str, db: AsyncSession
+        client_id: UUID, collection_name: str, document_id: str, db: AsyncSession
     ) -> APIResponse:
         """Get a document by ID from a dynamic collection using Motor"""
+        # Documents store client_id as a string
+        client_id = str(client_id)
         try:
             # Get active schema
             schema = await DocumentService._get_active_schema(
@@ -243,15 +354,33 @@ class DocumentService:
                 detail=f"Error retrieving document: {str(e)}",
             )
 
+    @staticmethod
+    async def exists(
+        client_id: UUID, collection_name: str, document_id: str
+    ) -> bool:
+        """Check whether a document exists without fetching it"""
+        try:
+            object_id = ObjectId(document_id)
+        except InvalidId:
+            return False
+
+        collection = get_mongo_db()[collection_name]
+        count = await collection.count_documents(
+            {"_id": object_id, "client_id": str(client_id)}, limit=1
+        )
+        return count > 0
+
     @staticmethod
     async def get_all(
-        client_id: str,
+        client_id: UUID,
         collection_name: str,
         db: AsyncSession,
         skip: int = 0,
         limit: int = 100,
     ) -> APIResponse:
         """Get all documents from a dynamic collection using Motor"""
+        # Documents store client_id as a string
+        client_id = str(client_id)
         try:
             # Get active schema
             schema = await DocumentService._get_active_schema(
@@ -305,7 +434,7 @@ class DocumentService:
 
     @staticmethod
     async def search(
-        client_id: str,
+        client_id: UUID,
         collection_name: str,
         column: str,
         value: str,
@@ -327,6 +456,8 @@ class DocumentService:
         Returns:
             APIResponse with best matching document
         """
+        # Documents store client_id as a string
+        client_id = str(client_id)
         try:
             # Get active schema
             schema = await DocumentService._get_active_schema(
@@ -428,7 +559,7 @@ class DocumentService:
 
     @staticmethod
     async def update(
-        client_id: str,
+        client_id: UUID,
         collection_name: str,
         document_id: str,
         data: Dict[str, Any],
@@ -436,6 +567,8 @@ class DocumentService:
         updated_by: Optional[str] = None,
     ) -> APIResponse:
         """Update a document in a dynamic collection using Motor"""
+        # Documents store client_id as a string
+        client_id = str(client_id)
         try:
             # Get active schema
             schema = await DocumentService._get_active_schema(
@@ -545,9 +678,11 @@ class DocumentService:
 
     @staticmethod
     async def delete(
-        client_id: str, collection_name: str, document_id: str, db: AsyncSession
+        client_id: UUID, collection_name: str, document_id: str, db: AsyncSession
     ) -> APIResponse:
         """Delete a document from a dynamic collection using Motor"""
+        # Documents store client_id as a string
+        client_id = str(client_id)
         try:
             # Get active schema
             schema = await DocumentService._get_active_schema(
@@ -1,19 +1,24 @@
 from fastapi import HTTPException
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from client_service.schemas.client_db.client_models import ClientEntity, Clients
 from client_service.schemas.pydantic_schemas import ClientEntityCreate, ClientEntityUpdate, ClientEntityResponse
 from client_service.api.constants.messages import EntityMessages
 from client_service.api.constants.status_codes import StatusCode
 from client_service.schemas.base_response import APIResponse
+from client_service.utils.pagination import cursor_meta, paginate
 from datetime import datetime, timezone
-from typing import List
-from rapidfuzz import fuzz
+from typing import List, Optional
+from rapidfuzz import fuzz, process
 import logging
 from uuid import UUID
 
 logger = logging.getLogger(__name__)
 
+# Built once at import and reused to serialize created rows in one call
+_client_entity_response_list = TypeAdapter(List[ClientEntityResponse])
+
 
 class EntityService:
     """Service class for Entity business logic"""
@@ -65,38 +70,26 @@ class EntityService:
                 
                 batch_entities[entity.client_id][entity.entity_name] = idx
             
-            # Validation Phase 4: Create all new entity records
-            new_entities = []
-            for entity_data in entity_data:
-                try:
-                    # Create new entity instance (UUID will be auto-generated)
-                    new_entity = ClientEntity(**entity_data.model_dump(exclude_unset=True))
-                    new_entities.append(new_entity)
-                    
-                except Exception as e:
-                    logger.error(f"Error preparing entity {entity_data.entity_name}: {str(e)}")
-                    raise HTTPException(
-                        status_code=StatusCode.BAD_REQUEST,
-                        detail=f"Error preparing entity {entity_data.entity_name}: {str(e)}"
-                    )
+            # Validation Phase 4: Build insert rows for all new entity records
+            new_rows = [entity.model_dump(exclude_unset=True) for entity in entity_data]
             
-            # Commit Phase: Add all to session and commit atomically
-            for new_entity in new_entities:
-                db.add(new_entity)
+            # Commit Phase: Insert all rows in one INSERT ... RETURNING and commit atomically
+            result = await db.scalars(
+                insert(ClientEntity).returning(ClientEntity, sort_by_parameter_order=True),
+                new_rows
+            )
+            new_entities = result.all()
             
             await db.commit()
             
-            # Refresh all entities to get generated IDs
-            for new_entity in new_entities:
-                await db.refresh(new_entity)
-                created_entities.append(
-                    ClientEntityResponse.model_validate(new_entity).model_dump()
-                )
+            created_entities = _client_entity_response_list.dump_python(
+                _client_entity_response_list.validate_python(new_entities, from_attributes=True)
+            )
             
             # Success logging and response
             logger.info(f"Successfully created {len(created_entities)} entity(ies)")
             
-            return APIResponse(
+            return APIResponse.model_construct(
                 success=True,
                 message=f"Successfully created {len(created_entities)} entity(ies)",
                 data=created_entities
@@ -117,10 +110,8 @@ class EntityService:
     async def get_by_id(entity_id: UUID, db: AsyncSession):
         """Get an entity by ID"""
         try:
-            result = await db.execute(
-                select(ClientEntity).where(ClientEntity.entity_id == entity_id)
-            )
-            entity = result.scalar_one_or_none()
+            # Primary-key lookup through the identity map and a cached PK SELECT
+            entity = await db.get(ClientEntity, entity_id)
             
             if not entity:
                 raise HTTPException(
@@ -129,7 +120,7 @@ class EntityService:
                 )
             
             logger.info(EntityMessages.RETRIEVED_SUCCESS.format(name=entity.entity_name))
-            return APIResponse(
+            return APIResponse.model_construct(
                 success=True,   
                 message=EntityMessages.RETRIEVED_SUCCESS.format(name=entity.entity_name),
                 data=ClientEntityResponse.model_validate(entity).model_dump()
@@ -145,19 +136,20 @@ class EntityService:
             )
 
     @staticmethod
-    async def get_all(skip: int, limit: int, db: AsyncSession):
+    async def get_all(skip: int, limit: int, db: AsyncSession, after: Optional[UUID] = None):
         """Get all entities with pagination"""
         try:
             result = await db.execute(
-                select(ClientEntity).offset(skip).limit(limit)
+                paginate(select(ClientEntity), ClientEntity.entity_id, skip, limit, after)
             )
             entities = result.scalars().all()
             
             logger.info(EntityMessages.RETRIEVED_ALL_SUCCESS.format(count=len(entities)))
-            return APIResponse(
+            return APIResponse.model_construct(
                 success=True,
                 message=EntityMessages.RETRIEVED_ALL_SUCCESS.format(count=len(entities)),
-                data=[ClientEntityResponse.model_validate(entity).model_dump() for entity in entities]
+                data=[ClientEntityResponse.model_validate(entity).model_dump() for entity in entities],
+                meta=cursor_meta(entities, "entity_id", limit)
             )
 
 
@@ -182,7 +174,7 @@ class EntityService:
                 return []
             
             logger.info(EntityMessages.RETRIEVED_BY_CLIENT_SUCCESS.format(count=len(entities), id=client_id))
-            return APIResponse(
+            return APIResponse.model_construct(
                 success=True,   
                 message=EntityMessages.RETRIEVED_BY_CLIENT_SUCCESS.format(count=len(entities), id=client_id),
                 data=[ClientEntityResponse.model_validate(entity).model_dump() for entity in entities]
@@ -230,52 +222,53 @@ class EntityService:
             value = value.strip()
             
 
-            # Get ALL entities from database
-            result = await db.execute(select(ClientEntity))
-            all_entities = result.scalars().all()
-            
-            matches = []
-
-            for entity in all_entities:
-                # Get the value of the column we're searching
-                entity_value = getattr(entity, column)
-
-                if entity_value:
-                    # Calculate similarity score using rapidfuzz
-                    score = fuzz.partial_ratio(value.lower(), str(entity_value).lower())
-
-                    if score >= threshold:
-                        matches.append({
-                            "entity": entity,
-                            "score": score
-                        })
-                        logger.debug(f"Match found: '{entity_value}' (score: {score})")
+            # Fetch only the primary key and the searched column instead of full rows
+            search_column = allowed_columns[column]
+            result = await db.execute(
+                select(ClientEntity.entity_id, search_column).where(search_column.isnot(None))
+            )
+            candidates = {
+                entity_id: str(entity_value).lower()
+                for entity_id, entity_value in result.all()
+                if entity_value
+            }
 
-            # Sort by score descending and take top N
-            matches.sort(key=lambda x: x["score"], reverse=True)
-            top_matches = matches[:top_n]
+            # Score all candidates in rapidfuzz's native loop and keep the best top N
+            top_matches = process.extract(
+                value.lower(),
+                candidates,
+                scorer=fuzz.partial_ratio,
+                score_cutoff=threshold,
+                limit=top_n,
+            )
 
             if not top_matches:
                 logger.info(EntityMessages.NO_SEARCH_RESULTS.format(column=column, value=value))
-                return APIResponse(
+                return APIResponse.model_construct(
                     success=True,
                     message=EntityMessages.NO_SEARCH_RESULTS.format(column=column, value=value),
                     data=[]
                 )
 
+            # Load full rows for the top matches only, keeping score order
+            matched_ids = [entity_id for _, _, entity_id in top_matches]
+            result = await db.execute(
+                select(ClientEntity).where(ClientEntity.entity_id.in_(matched_ids))
+            )
+            entities_by_id = {entity.entity_id: entity for entity in result.scalars().all()}
+
             # Serialize the top matches
             serialized_matches = [
-                {
-                    **ClientEntityResponse.model_validate(match["entity"]).model_dump()
-                }
-                for match in top_matches
+                ClientEntityResponse.model_validate(entities_by_id[entity_id]).model_dump()
+                for entity_id in matched_ids
+                if entity_id in entities_by_id
             ]
 
             logger.info(
                 f"Found {len(top_matches)} match(es) for {column}='{value}'"
             )
 
-            return APIResponse(
+            return APIResponse.model_construct(
                 success=True,
                 message=f"Found {len(top_matches)} match(es) where {column} matches '{value}'",
                 data=serialized_matches,
@@ -315,7 +308,7 @@ class EntityService:
             await db.refresh(entity)
             
             logger.info(EntityMessages.UPDATED_SUCCESS.format(name=entity.entity_name))
-            return APIResponse(
+            return APIResponse.model_construct(
                 success=True,
                 message=EntityMessages.UPDATED_SUCCESS.format(name=entity.entity_name),
                 data=ClientEntityResponse.model_validate(entity).model_dump()
@@ -350,7 +343,7 @@ class EntityService:
             await db.commit()
             
             logger.info(EntityMessages.DELETED_SUCCESS.format(id=entity_id))
-            return APIResponse(
+            return APIResponse.model_construct(
                 success=True,
                 message=EntityMessages.DELETED_SUCCESS.format(id=entity_id),
                 data=None
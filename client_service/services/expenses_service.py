@@ -61,17 +61,17 @@ class ExpenseService:
             
             # Validation Phase 4: Create all new category records
             new_categories = []
-            for category_data in category_data:
+            for item in category_data:
                 try:
                     # Create new category instance (UUID will be auto-generated)
-                    new_category = ExpenseMaster(**category_data.model_dump(exclude_unset=True))
+                    new_category = ExpenseMaster(**item.model_dump(exclude_unset=True))
                     new_categories.append(new_category)
                     
                 except Exception as e:
-                    logger.error(f"Error preparing category {category_data.category_name}: {str(e)}")
+                    logger.error(f"Error preparing category {item.category_name}: {str(e)}")
                     raise HTTPException(
                         status_code=StatusCode.BAD_REQUEST,
-                        detail=f"Error preparing category {category_data.category_name}: {str(e)}"
+                        detail=f"Error preparing category {item.category_name}: {str(e)}"
                     )
             
             # Commit Phase: Add all to session and commit atomically
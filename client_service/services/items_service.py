@@ -1,19 +1,24 @@
 from fastapi import HTTPException
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from client_service.schemas.client_db.item_models import ItemMaster
 from client_service.schemas.pydantic_schemas import ItemCreate, ItemUpdate, ItemResponse
 from client_service.api.constants.messages import ItemMessages
 from client_service.api.constants.status_codes import StatusCode
 from client_service.schemas.base_response import APIResponse
+from client_service.utils.pagination import cursor_meta, paginate
 from datetime import datetime, timezone
 import logging
 from uuid import UUID
-from typing import List
+from typing import List, Optional
 
 
 logger = logging.getLogger(__name__)
 
+# Built once at import and reused to serialize created rows in one call
+_item_response_list = TypeAdapter(List[ItemResponse])
+
 
 class ItemService:
     """Service class for Item business logic"""
@@ -59,38 +64,26 @@ class ItemService:
                     detail=f"The following item codes already exist: {', '.join(existing_codes)}"
                 )
             
-            # Validation Phase 4: Create all new item records
-            new_items = []
-            for item_data in item_data:
-                try:
-                    # Create new item instance (UUID will be auto-generated)
-                    new_item = ItemMaster(**item_data.model_dump(exclude_unset=True))
-                    new_items.append(new_item)
-                    
-                except Exception as e:
-                    logger.error(f"Error preparing item {item_data.item_code}: {str(e)}")
-                    raise HTTPException(
-                        status_code=StatusCode.BAD_REQUEST,
-                        detail=f"Error preparing item {item_data.item_code}: {str(e)}"
-                    )
+            # Validation Phase 4: Build insert rows for all new item records
+            new_rows = [item.model_dump(exclude_unset=True) for item in item_data]
             
-            # Commit Phase: Add all to session and commit atomically
-            for new_item in new_items:
-                db.add(new_item)
+            # Commit Phase: Insert all rows in one INSERT ... RETURNING and commit atomically
+            result = await db.scalars(
+                insert(ItemMaster).returning(ItemMaster, sort_by_parameter_order=True),
+                new_rows
+            )
+            new_items = result.all()
             
             await db.commit()
             
-            # Refresh all items to get generated IDs
-            for new_item in new_items:
-                await db.refresh(new_item)
-                created_items.append(
-                    ItemResponse.model_validate(new_item).model_dump()
-                )
+            created_items = _item_response_list.dump_python(
+                _item_response_list.validate_python(new_items, from_attributes=True)
+            )
             
             # Success logging and response
             logger.info(f"Successfully created {len(created_items)} item(s)")
             
-            return APIResponse(
+            return APIResponse.model_construct(
                 success=True,
                 message=f"Successfully created {len(created_items)} item(s)",
                 data=created_items
@@ -111,10 +104,8 @@ class ItemService:
     async def get_by_id(item_id: UUID, db: AsyncSession):
         """Get an item by ID"""
         try:
-            result = await db.execute(
-                select(ItemMaster).where(ItemMaster.item_id == item_id)
-            )
-            item = result.scalar_one_or_none()
+            # Primary-key lookup through the identity map and a cached PK SELECT
+            item = await db.get(ItemMaster, item_id)
             
             if not item:
                 raise HTTPException(
@@ -123,7 +114,7 @@ class ItemService:
                 )
             
             logger.info(ItemMessages.RETRIEVED_SUCCESS.format(name=item.item_name))
-            return APIResponse(
+            return APIResponse.model_construct(
                 success=True,
                 message=ItemMessages.RETRIEVED_SUCCESS.format(name=item.item_name),
                 data=ItemResponse.model_validate(item).model_dump()
@@ -139,19 +130,20 @@ class ItemService:
             )
 
     @staticmethod
-    async def get_all(skip: int, limit: int, db: AsyncSession):
+    async def get_all(skip: int, limit: int, db: AsyncSession, after: Optional[UUID] = None):
         """Get all items with pagination"""
         try:
             result = await db.execute(
-                select(ItemMaster).offset(skip).limit(limit)
+                paginate(select(ItemMaster), ItemMaster.item_id, skip, limit, after)
             )
             items = result.scalars().all()
             
             logger.info(ItemMessages.RETRIEVED_ALL_SUCCESS.format(count=len(items)))
-            return APIResponse(
+            return APIResponse.model_construct(
                 success=True,
                 message=ItemMessages.RETRIEVED_ALL_SUCCESS.format(count=len(items)),
-                data=[ItemResponse.model_validate(item).model_dump() for item in items]
+                data=[ItemResponse.model_validate(item).model_dump() for item in items],
+                meta=cursor_meta(items, "item_id", limit)
             )
 
         except Exception as e:
@@ -177,7 +169,7 @@ class ItemService:
                 )
             
             logger.info(ItemMessages.RETRIEVED_BY_CODE_SUCCESS.format(name=item.item_name))
-            return APIResponse(
+            return APIResponse.model_construct(
                 success=True,
                 message=ItemMessages.RETRIEVED_BY_CODE_SUCCESS.format(name=item.item_name),
                 data=ItemResponse.model_validate(item).model_dump()
@@ -217,7 +209,7 @@ class ItemService:
             await db.refresh(item)
             
             logger.info(ItemMessages.UPDATED_SUCCESS.format(name=item.item_name))
-            return APIResponse(
+            return APIResponse.model_construct(
                 success=True,
                 message=ItemMessages.UPDATED_SUCCESS.format(name=item.item_name),
                 data=ItemResponse.model_validate(item).model_dump()
@@ -252,7 +244,7 @@ class ItemService:
             await db.commit()
             
             logger.info(ItemMessages.DELETED_SUCCESS.format(id=item_id))
-            return APIResponse(
+            return APIResponse.model_construct(
                 success=True,
                 message=ItemMessages.DELETED_SUCCESS.format(id=item_id),
                 data=None
@@ -40,10 +40,10 @@ class LogService:
             
             # Validation Phase 2: Create all new action log records
             new_action_logs = []
-            for action_log_data in action_log_data:
+            for item in action_log_data:
                 try:
                     # Create new action log instance (UUID will be auto-generated)
-                    new_action_log = ActionLog(**action_log_data.model_dump(exclude_unset=True))
+                    new_action_log = ActionLog(**item.model_dump(exclude_unset=True))
                     new_action_logs.append(new_action_log)
                     
                 except Exception as e:
@@ -226,10 +226,10 @@ class LogService:
             
             # Validation Phase 7: Create all new transaction log records
             new_transaction_logs = []
-            for transaction_log_data in transaction_log_data:
+            for item in transaction_log_data:
                 try:
                     # Create new transaction log instance (UUID will be auto-generated)
-                    new_transaction_log = TransactionLog(**transaction_log_data.model_dump(exclude_unset=True))
+                    new_transaction_log = TransactionLog(**item.model_dump(exclude_unset=True))
                     new_transaction_logs.append(new_transaction_log)
                     
                 except Exception as e:
@@ -367,10 +367,10 @@ class LogService:
             
             # Validation Phase 4: Create all new user log records
             new_user_logs = []
-            for user_log_data in user_log_data:
+            for item in user_log_data:
                 try:
                     # Create new user log instance (UUID will be auto-generated)
-                    new_user_log = UserLog(**user_log_data.model_dump(exclude_unset=True))
+                    new_user_log = UserLog(**item.model_dump(exclude_unset=True))
                     new_user_logs.append(new_user_log)
                     
                 except Exception as e:
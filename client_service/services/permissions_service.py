@@ -1,17 +1,22 @@
 from fastapi import HTTPException
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from client_service.schemas.client_db.user_models import Permissions
 from client_service.schemas.pydantic_schemas import PermissionCreate, PermissionUpdate, PermissionResponse
 from client_service.api.constants.messages import PermissionMessages
 from client_service.api.constants.status_codes import StatusCode
 from client_service.schemas.base_response import APIResponse
+from client_service.utils.pagination import cursor_meta, paginate
 import logging
 from uuid import UUID
-from typing import List
+from typing import List, Optional
 
 logger = logging.getLogger(__name__)
 
+# Built once at import and reused to serialize created rows in one call
+_permission_response_list = TypeAdapter(List[PermissionResponse])
+
 
 class PermissionService:
     """Service class for Permission business logic"""
@@ -57,38 +62,26 @@ class PermissionService:
                     detail=f"The following permission names already exist: {', '.join(existing_names)}"
                 )
             
-            # Validation Phase 4: Create all new permission records
-            new_permissions = []
-            for permission_data in permission_data:
-                try:
-                    # Create new permission instance (UUID will be auto-generated)
-                    new_permission = Permissions(**permission_data.model_dump(exclude_unset=True))
-                    new_permissions.append(new_permission)
-                    
-                except Exception as e:
-                    logger.error(f"Error preparing permission {permission_data.permission_name}: {str(e)}")
-                    raise HTTPException(
-                        status_code=StatusCode.BAD_REQUEST,
-                        detail=f"Error preparing permission {permission_data.permission_name}: {str(e)}"
-                    )
+            # Validation Phase 4: Build insert rows for all new permission records
+            new_rows = [permission.model_dump(exclude_unset=True) for permission in permission_data]
             
-            # Commit Phase: Add all to session and commit atomically
-            for new_permission in new_permissions:
-                db.add(new_permission)
+            # Commit Phase: Insert all rows in one INSERT ... RETURNING and commit atomically
+            result = await db.scalars(
+                insert(Permissions).returning(Permissions, sort_by_parameter_order=True),
+                new_rows
+            )
+            new_permissions = result.all()
             
             await db.commit()
             
-            # Refresh all permissions to get generated IDs
-            for new_permission in new_permissions:
-                await db.refresh(new_permission)
-                created_permissions.append(
-                    PermissionResponse.model_validate(new_permission).model_dump()
-                )
+            created_permissions = _permission_response_list.dump_python(
+                _permission_response_list.validate_python(new_permissions, from_attributes=True)
+            )
             
             # Success logging and response
             logger.info(f"Successfully created {len(created_permissions)} permission(s)")
             
-            return APIResponse(
+            return APIResponse.model_construct(
                 success=True,
                 message=f"Successfully created {len(created_permissions)} permission(s)",
                 data=created_permissions
@@ -109,10 +102,8 @@ class PermissionService:
     async def get_by_id(permission_id: UUID, db: AsyncSession):
         """Get a permission by ID"""
         try:
-            result = await db.execute(
-                select(Permissions).where(Permissions.permission_id == permission_id)
-            )
-            permission = result.scalar_one_or_none()
+            # Primary-key lookup through the identity map and a cached PK SELECT
+            permission = await db.get(Permissions, permission_id)
             
             if not permission:
                 raise HTTPException(
@@ -121,7 +112,7 @@ class PermissionService:
                 )
             
             logger.info(PermissionMessages.RETRIEVED_SUCCESS.format(name=permission.permission_name))
-            return APIResponse(
+            return APIResponse.model_construct(
                 success=True,
                 message=PermissionMessages.RETRIEVED_SUCCESS.format(name=permission.permission_name),
                 data=PermissionResponse.model_validate(permission).model_dump()
@@ -137,19 +128,20 @@ class PermissionService:
             )
 
     @staticmethod
-    async def get_all(skip: int, limit: int, db: AsyncSession):
+    async def get_all(skip: int, limit: int, db: AsyncSession, after: Optional[UUID] = None):
         """Get all permissions with pagination"""
         try:
             result = await db.execute(
-                select(Permissions).offset(skip).limit(limit)
+                paginate(select(Permissions), Permissions.permission_id, skip, limit, after)
             )
             permissions = result.scalars().all()
             
             logger.info(PermissionMessages.RETRIEVED_ALL_SUCCESS.format(count=len(permissions)))
-            return APIResponse(
+            return APIResponse.model_construct(
                 success=True,
                 message=PermissionMessages.RETRIEVED_ALL_SUCCESS.format(count=len(permissions)),
-                data=[PermissionResponse.model_validate(perm).model_dump() for perm in permissions]
+                data=[PermissionResponse.model_validate(perm).model_dump() for perm in permissions],
+                meta=cursor_meta(permissions, "permission_id", limit)
             )
 
         except Exception as e:
@@ -182,7 +174,7 @@ class PermissionService:
             await db.refresh(permission)
             
             logger.info(PermissionMessages.UPDATED_SUCCESS.format(name=permission.permission_name))
-            return APIResponse(
+            return APIResponse.model_construct(
                 success=True,
                 message=PermissionMessages.UPDATED_SUCCESS.format(name=permission.permission_name),
                 data=PermissionResponse.model_validate(permission).model_dump()
@@ -217,7 +209,7 @@ class PermissionService:
             await db.commit()
             
             logger.info(PermissionMessages.DELETED_SUCCESS.format(id=permission_id))
-            return APIResponse(
+            return APIResponse.model_construct(
                 success=True,
                 message=PermissionMessages.DELETED_SUCCESS.format(id=permission_id),
                 data=None
@@ -1,6 +1,6 @@
 from fastapi import HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from client_service.schemas.client_db.user_models import RolePermissions, Roles, Permissions
 from client_service.schemas.pydantic_schemas import RolePermissionCreate, RolePermissionResponse
 from client_service.api.constants.messages import RolePermissionMessages
@@ -65,10 +65,6 @@ class RolePermissionService:
                     detail=f"The following permission IDs do not exist: {', '.join(str(id) for id in missing_permission_ids)}"
                 )
             
-            # Create role and permission lookup maps for reference
-            roles_map = {role.role_id: role for role in existing_roles}
-            permissions_map = {perm.permission_id: perm for perm in existing_permissions}
-            
             # Validation Phase 5: Check for duplicate assignments within batch
             batch_assignments = set()
             for idx, role_permission in enumerate(role_permission_data):
@@ -106,38 +102,23 @@ class RolePermissionService:
                     detail=f"The following role-permission assignments already exist: {', '.join(already_assigned_str)}"
                 )
             
-            # Validation Phase 7: Create all new role permission records
-            new_role_permissions = []
-            for role_permission_data in role_permission_data:
-                try:
-                    # Create new role permission instance
-                    new_role_permission = RolePermissions(**role_permission_data.model_dump(exclude_unset=True))
-                    new_role_permissions.append(new_role_permission)
-                    
-                except Exception as e:
-                    logger.error(f"Error preparing role permission assignment: {str(e)}")
-                    raise HTTPException(
-                        status_code=StatusCode.BAD_REQUEST,
-                        detail=f"Error preparing role permission assignment: {str(e)}"
-                    )
+            # Validation Phase 7: Build insert rows for all new role permission records
+            new_rows = [role_permission.model_dump(exclude_unset=True) for role_permission in role_permission_data]
             
-            # Commit Phase: Add all to session and commit atomically
-            for new_role_permission in new_role_permissions:
-                db.add(new_role_permission)
+            # Commit Phase: Insert all rows in one INSERT ... RETURNING and commit atomically,
+            # instead of refreshing each assignment with its own SELECT afterwards
+            result = await db.scalars(
+                insert(RolePermissions).returning(RolePermissions, sort_by_parameter_order=True),
+                new_rows
+            )
+            new_role_permissions = result.all()
             
             await db.commit()
             
-            # Refresh all assignments to get metadata and build response
-            for new_role_permission in new_role_permissions:
-                await db.refresh(new_role_permission)
-                
-                # Get role and permission names for logging
-                role = roles_map.get(new_role_permission.role_id)
-                permission = permissions_map.get(new_role_permission.permission_id)
-                
-                assigned_permissions.append(
-                    RolePermissionResponse.model_validate(new_role_permission).model_dump()
-                )
+            assigned_permissions = [
+                RolePermissionResponse.model_validate(new_role_permission).model_dump()
+                for new_role_permission in new_role_permissions
+            ]
             
             # Success logging and response
             logger.info(f"Successfully assigned {len(assigned_permissions)} permission(s)")
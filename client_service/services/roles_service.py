@@ -1,17 +1,22 @@
 from fastapi import HTTPException
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from client_service.schemas.client_db.user_models import Roles
 from client_service.schemas.pydantic_schemas import RoleCreate, RoleUpdate, RoleResponse
 from client_service.api.constants.messages import RoleMessages
 from client_service.api.constants.status_codes import StatusCode
 from client_service.schemas.base_response import APIResponse
+from client_service.utils.pagination import cursor_meta, paginate
 import logging
 from uuid import UUID
-from typing import List
+from typing import List, Optional
 
 logger = logging.getLogger(__name__)
 
+# Built once at import and reused to serialize created rows in one call
+_role_response_list = TypeAdapter(List[RoleResponse])
+
 
 class RoleService:
     """Service class for Role business logic"""
@@ -57,38 +62,26 @@ class RoleService:
                     detail=f"The following role names already exist: {', '.join(existing_names)}"
                 )
             
-            # Validation Phase 4: Create all new role records
-            new_roles = []
-            for role_data in role_data:
-                try:
-                    # Create new role instance (UUID will be auto-generated)
-                    new_role = Roles(**role_data.model_dump(exclude_unset=True))
-                    new_roles.append(new_role)
-                    
-                except Exception as e:
-                    logger.error(f"Error preparing role {role_data.role_name}: {str(e)}")
-                    raise HTTPException(
-                        status_code=StatusCode.BAD_REQUEST,
-                        detail=f"Error preparing role {role_data.role_name}: {str(e)}"
-                    )
+            # Validation Phase 4: Build insert rows for all new role records
+            new_rows = [role.model_dump(exclude_unset=True) for role in role_data]
             
-            # Commit Phase: Add all to session and commit atomically
-            for new_role in new_roles:
-                db.add(new_role)
+            # Commit Phase: Insert all rows in one INSERT ... RETURNING and commit atomically
+            result = await db.scalars(
+                insert(Roles).returning(Roles, sort_by_parameter_order=True),
+                new_rows
+            )
+            new_roles = result.all()
             
             await db.commit()
             
-            # Refresh all roles to get generated IDs
-            for new_role in new_roles:
-                await db.refresh(new_role)
-                created_roles.append(
-                    RoleResponse.model_validate(new_role).model_dump()
-                )
+            created_roles = _role_response_list.dump_python(
+                _role_response_list.validate_python(new_roles, from_attributes=True)
+            )
             
             # Success logging and response
             logger.info(f"Successfully created {len(created_roles)} role(s)")
             
-            return APIResponse(
+            return APIResponse.model_construct(
                 success=True,
                 message=f"Successfully created {len(created_roles)} role(s)",
                 data=created_roles
@@ -109,10 +102,8 @@ class RoleService:
     async def get_by_id(role_id: UUID, db: AsyncSession):
         """Get a role by ID"""
         try:
-            result = await db.execute(
-                select(Roles).where(Roles.role_id == role_id)
-            )
-            role = result.scalar_one_or_none()
+            # Primary-key lookup through the identity map and a cached PK SELECT
+            role = await db.get(Roles, role_id)
             
             if not role:
                 raise HTTPException(
@@ -121,7 +112,7 @@ class RoleService:
                 )
             
             logger.info(RoleMessages.RETRIEVED_SUCCESS.format(name=role.role_name))
-            return APIResponse(
+            return APIResponse.model_construct(
                 success=True,
                 message=RoleMessages.RETRIEVED_SUCCESS.format(name=role.role_name),
                 data=RoleResponse.model_validate(role).model_dump()
@@ -137,19 +128,20 @@ class RoleService:
             )
 
     @staticmethod
-    async def get_all(skip: int, limit: int, db: AsyncSession):
+    async def get_all(skip: int, limit: int, db: AsyncSession, after: Optional[UUID] = None):
         """Get all roles with pagination"""
         try:
             result = await db.execute(
-                select(Roles).offset(skip).limit(limit)
+                paginate(select(Roles), Roles.role_id, skip, limit, after)
             )
             roles = result.scalars().all()
             
             logger.info(RoleMessages.RETRIEVED_ALL_SUCCESS.format(count=len(roles)))
-            return APIResponse(
+            return APIResponse.model_construct(
                 success=True,
                 message=RoleMessages.RETRIEVED_ALL_SUCCESS.format(count=len(roles)),
-                data=[RoleResponse.model_validate(role).model_dump() for role in roles]
+                data=[RoleResponse.model_validate(role).model_dump() for role in roles],
+                meta=cursor_meta(roles, "role_id", limit)
             )
 
         except Exception as e:
@@ -182,7 +174,7 @@ class RoleService:
             await db.refresh(role)
             
             logger.info(RoleMessages.UPDATED_SUCCESS.format(name=role.role_name))
-            return APIResponse(
+            return APIResponse.model_construct(
                 success=True,
                 message=RoleMessages.UPDATED_SUCCESS.format(name=role.role_name),
                 data=RoleResponse.model_validate(role).model_dump()
@@ -218,7 +210,7 @@ class RoleService:
             await db.commit()
             
             logger.info(RoleMessages.DELETED_SUCCESS.format(id=role_id))
-            return APIResponse(
+            return APIResponse.model_construct(
                 success=True,
                 message=RoleMessages.DELETED_SUCCESS.format(id=role_id),
                 data=None
@@ -78,17 +78,17 @@ class TransactionService:
             
             # Validation Phase 6: Create all new transaction records
             new_transactions = []
-            for transaction_data in transaction_data:
+            for item in transaction_data:
                 try:
                     # Create new transaction instance (UUID will be auto-generated)
-                    new_transaction = VendorTransactions(**transaction_data.model_dump(exclude_unset=True))
+                    new_transaction = VendorTransactions(**item.model_dump(exclude_unset=True))
                     new_transactions.append(new_transaction)
                     
                 except Exception as e:
-                    logger.error(f"Error preparing transaction {transaction_data.invoice_id}: {str(e)}")
+                    logger.error(f"Error preparing transaction {item.invoice_id}: {str(e)}")
                     raise HTTPException(
                         status_code=StatusCode.BAD_REQUEST,
-                        detail=f"Error preparing transaction {transaction_data.invoice_id}: {str(e)}"
+                        detail=f"Error preparing transaction {item.invoice_id}: {str(e)}"
                     )
             
             # Commit Phase: Add all to session and commit atomically
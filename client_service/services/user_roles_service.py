@@ -1,6 +1,6 @@
 from fastapi import HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from client_service.schemas.client_db.user_models import UserRoles, Users, Roles
 from client_service.schemas.pydantic_schemas import UserRoleCreate, UserRoleResponse
 from client_service.api.constants.messages import UserRoleMessages
@@ -65,10 +65,6 @@ class UserRoleService:
                     detail=f"The following role IDs do not exist: {', '.join(str(id) for id in missing_role_ids)}"
                 )
             
-            # Create user and role lookup maps for reference
-            users_map = {user.user_id: user for user in existing_users}
-            roles_map = {role.role_id: role for role in existing_roles}
-            
             # Validation Phase 5: Check for duplicate assignments within batch
             batch_assignments = set()
             for idx, user_role in enumerate(user_role_data):
@@ -106,38 +102,23 @@ class UserRoleService:
                     detail=f"The following user-role assignments already exist: {', '.join(already_assigned_str)}"
                 )
             
-            # Validation Phase 7: Create all new user role records
-            new_user_roles = []
-            for user_role_data in user_role_data:
-                try:
-                    # Create new user role instance
-                    new_user_role = UserRoles(**user_role_data.model_dump(exclude_unset=True))
-                    new_user_roles.append(new_user_role)
-                    
-                except Exception as e:
-                    logger.error(f"Error preparing user role assignment: {str(e)}")
-                    raise HTTPException(
-                        status_code=StatusCode.BAD_REQUEST,
-                        detail=f"Error preparing user role assignment: {str(e)}"
-                    )
+            # Validation Phase 7: Build insert rows for all new user role records
+            new_rows = [user_role.model_dump(exclude_unset=True) for user_role in user_role_data]
             
-            # Commit Phase: Add all to session and commit atomically
-            for new_user_role in new_user_roles:
-                db.add(new_user_role)
+            # Commit Phase: Insert all rows in one INSERT ... RETURNING and commit atomically,
+            # instead of refreshing each assignment with its own SELECT afterwards
+            result = await db.scalars(
+                insert(UserRoles).returning(UserRoles, sort_by_parameter_order=True),
+                new_rows
+            )
+            new_user_roles = result.all()
             
             await db.commit()
             
-            # Refresh all assignments to get metadata and build response
-            for new_user_role in new_user_roles:
-                await db.refresh(new_user_role)
-                
-                # Get user and role names for logging
-                user = users_map.get(new_user_role.user_id)
-                role = roles_map.get(new_user_role.role_id)
-                
-                assigned_roles.append(
-                    UserRoleResponse.model_validate(new_user_role).model_dump()
-                )
+            assigned_roles = [
+                UserRoleResponse.model_validate(new_user_role).model_dump()
+                for new_user_role in new_user_roles
+            ]
             
             # Success logging and response
             logger.info(f"Successfully assigned {len(assigned_roles)} role(s)")
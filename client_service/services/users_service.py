@@ -1,19 +1,24 @@
 from fastapi import HTTPException
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from client_service.schemas.client_db.user_models import Users,Roles
 from client_service.schemas.client_db.client_models import Clients
 from client_service.schemas.pydantic_schemas import UserCreate, UserUpdate, UserResponse
 from client_service.api.constants.messages import UserMessages
 from client_service.api.constants.status_codes import StatusCode
 from client_service.schemas.base_response import APIResponse
+from client_service.utils.pagination import cursor_meta, paginate
 from datetime import datetime, timezone
 import logging
 from uuid import UUID
-from typing import List
+from typing import List, Optional
 
 logger = logging.getLogger(__name__)
 
+# Built once at import and reused to serialize created rows in one call
+_user_response_list = TypeAdapter(List[UserResponse])
+
 
 class UserService:
     """Service class for User business logic"""
@@ -100,38 +105,26 @@ class UserService:
                     detail=f"The following client IDs do not exist: {', '.join(str(id) for id in missing_client_ids)}"
                 )
             
-            # Validation Phase 8: Create all new user records
-            new_users = []
-            for user_data in user_data:
-                try:
-                    # Create new user instance (UUID will be auto-generated)
-                    new_user = Users(**user_data.model_dump(exclude_unset=True))
-                    new_users.append(new_user)
-                    
-                except Exception as e:
-                    logger.error(f"Error preparing user {user_data.user_name}: {str(e)}")
-                    raise HTTPException(
-                        status_code=StatusCode.BAD_REQUEST,
-                        detail=f"Error preparing user {user_data.user_name}: {str(e)}"
-                    )
+            # Validation Phase 8: Build insert rows for all new user records
+            new_rows = [user.model_dump(exclude_unset=True) for user in user_data]
             
-            # Commit Phase: Add all to session and commit atomically
-            for new_user in new_users:
-                db.add(new_user)
+            # Commit Phase: Insert all rows in one INSERT ... RETURNING and commit atomically
+            result = await db.scalars(
+                insert(Users).returning(Users, sort_by_parameter_order=True),
+                new_rows
+            )
+            new_users = result.all()
             
             await db.commit()
             
-            # Refresh all users to get generated IDs
-            for new_user in new_users:
-                await db.refresh(new_user)
-                created_users.append(
-                    UserResponse.model_validate(new_user).model_dump()
-                )
+            created_users = _user_response_list.dump_python(
+                _user_response_list.validate_python(new_users, from_attributes=True)
+            )
             
             # Success logging and response
             logger.info(f"Successfully created {len(created_users)} user(s)")
             
-            return APIResponse(
+            return APIResponse.model_construct(
                 success=True,
                 message=f"Successfully created {len(created_users)} user(s)",
                 data=created_users
@@ -152,10 +145,8 @@ class UserService:
     async def get_by_id(user_id: UUID, db: AsyncSession):
         """Get a user by ID"""
         try:
-            result = await db.execute(
-                select(Users).where(Users.user_id == user_id)
-            )
-            user = result.scalar_one_or_none()
+            # Primary-key lookup through the identity map and a cached PK SELECT
+            user = await db.get(Users, user_id)
             
             if not user:
                 raise HTTPException(
@@ -164,7 +155,7 @@ class UserService:
                 )
             
             logger.info(UserMessages.RETRIEVED_SUCCESS.format(name=user.user_name))
-            return APIResponse(
+            return APIResponse.model_construct(
                 success=True,
                 message=UserMessages.RETRIEVED_SUCCESS.format(name=user.user_name),
                 data=UserResponse.model_validate(user).model_dump()
@@ -180,19 +171,20 @@ class UserService:
             )
 
     @staticmethod
-    async def get_all(skip: int, limit: int, db: AsyncSession):
+    async def get_all(skip: int, limit: int, db: AsyncSession, after: Optional[UUID] = None):
         """Get all users with pagination"""
         try:
             result = await db.execute(
-                select(Users).offset(skip).limit(limit)
+                paginate(select(Users), Users.user_id, skip, limit, after)
             )
             users = result.scalars().all()
             
             logger.info(UserMessages.RETRIEVED_ALL_SUCCESS.format(count=len(users)))
-            return APIResponse(
+            return APIResponse.model_construct(
                 success=True,
                 message=UserMessages.RETRIEVED_ALL_SUCCESS.format(count=len(users)),
-                data=[UserResponse.model_validate(user).model_dump() for user in users]
+                data=[UserResponse.model_validate(user).model_dump() for user in users],
+                meta=cursor_meta(users, "user_id", limit)
             )
 
         except Exception as e:
@@ -253,7 +245,7 @@ class UserService:
             await db.refresh(user)
             
             logger.info(UserMessages.UPDATED_SUCCESS.format(name=user.user_name))
-            return APIResponse(
+            return APIResponse.model_construct(
                 success=True,
                 message=UserMessages.UPDATED_SUCCESS.format(name=user.user_name),
                 data=UserResponse.model_validate(user).model_dump()
@@ -288,7 +280,7 @@ class UserService:
             await db.commit()
             
             logger.info(UserMessages.DELETED_SUCCESS.format(id=user_id))
-            return APIResponse(
+            return APIResponse.model_construct(
                 success=True,
                 message=UserMessages.DELETED_SUCCESS.format(id=user_id),
                 data=None
@@ -144,10 +144,10 @@ class VendorClassificationService:
             
             # Validation Phase 8: Create all new classification records
             new_classifications = []
-            for classification_data in classification_data:
+            for item in classification_data:
                 try:
                     # Create new classification instance
-                    new_classification = VendorClassification(**classification_data.model_dump(exclude_unset=True))
+                    new_classification = VendorClassification(**item.model_dump(exclude_unset=True))
                     new_classifications.append(new_classification)
                     
                 except Exception as e:
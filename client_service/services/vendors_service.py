@@ -61,17 +61,17 @@ class VendorService:
             
             # Validation Phase 4: Create all new vendor records
             new_vendors = []
-            for vendor_data in vendor_data:
+            for item in vendor_data:
                 try:
                     # Create new vendor instance (UUID will be auto-generated)
-                    new_vendor = VendorMaster(**vendor_data.model_dump(exclude_unset=True))
+                    new_vendor = VendorMaster(**item.model_dump(exclude_unset=True))
                     new_vendors.append(new_vendor)
                     
                 except Exception as e:
-                    logger.error(f"Error preparing vendor {vendor_data.vendor_code}: {str(e)}")
+                    logger.error(f"Error preparing vendor {item.vendor_code}: {str(e)}")
                     raise HTTPException(
                         status_code=StatusCode.BAD_REQUEST,
-                        detail=f"Error preparing vendor {vendor_data.vendor_code}: {str(e)}"
+                        detail=f"Error preparing vendor {item.vendor_code}: {str(e)}"
                     )
             
             # Commit Phase: Add all to session and commit atomically
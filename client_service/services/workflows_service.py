@@ -70,17 +70,17 @@ class WorkflowService:
             
             # Validation Phase 5: Create all new workflow records
             new_workflows = []
-            for workflow_data in workflow_data:
+            for item in workflow_data:
                 try:
                     # Create new workflow instance (UUID will be auto-generated)
-                    new_workflow = WorkflowRequestLedger(**workflow_data.model_dump(exclude_unset=True))
+                    new_workflow = WorkflowRequestLedger(**item.model_dump(exclude_unset=True))
                     new_workflows.append(new_workflow)
                     
                 except Exception as e:
-                    logger.error(f"Error preparing workflow {workflow_data.workflow_name}: {str(e)}")
+                    logger.error(f"Error preparing workflow {item.workflow_name}: {str(e)}")
                     raise HTTPException(
                         status_code=StatusCode.BAD_REQUEST,
-                        detail=f"Error preparing workflow {workflow_data.workflow_name}: {str(e)}"
+                        detail=f"Error preparing workflow {item.workflow_name}: {str(e)}"
                     )
             
             # Commit Phase: Add all to session and commit atomically
@@ -0,0 +1,60 @@
+import os
+
+# postgres_db and mongo_db build their clients at import time; give them parseable
+# settings, tests never connect to either
+for name, value in {
+    "DB_NAME": "client_service_test",
+    "DB_USER": "test",
+    "DB_PASSWORD": "test",
+    "DB_HOST": "localhost",
+    "DB_PORT": "5432",
+    "MONGO_URI": "mongodb://localhost:27017",
+    "MONGO_DB": "client_service_test",
+}.items():
+    os.environ.setdefault(name, value)
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from client_service.api.dependencies import get_database_session, get_read_session
+from client_service.utils.response_cache import response_cache
+
+
+@pytest.fixture
+def sqlite_db(tmp_path):
+    """File-backed SQLite database: a sync engine for seeding, an async session factory for the app"""
+    path = tmp_path / "client_service.db"
+    sync_engine = create_engine(f"sqlite:///{path}")
+    # NullPool so every request opens its connection on the TestClient's event loop
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}", poolclass=NullPool)
+    session_maker = async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+
+    yield sync_engine, session_maker
+
+    sync_engine.dispose()
+
+
+@pytest.fixture
+def make_client(sqlite_db):
+    """Build a TestClient for the given routers, with both session dependencies bound to SQLite"""
+    _, session_maker = sqlite_db
+
+    async def override_session():
+        async with session_maker() as session:
+            yield session
+
+    def factory(*routers):
+        app = FastAPI()
+        for router in routers:
+            app.include_router(router)
+        app.dependency_overrides[get_database_session] = override_session
+        app.dependency_overrides[get_read_session] = override_session
+        return TestClient(app)
+
+    response_cache.clear()
+    yield factory
+    response_cache.clear()
@@ -0,0 +1,36 @@
+import uuid
+from datetime import datetime, timezone
+
+from client_service.api.routes.central_clients_router import router
+from client_service.schemas.client_db.client_models import CentralClients
+
+
+def seed_central_clients(sync_engine, count):
+    CentralClients.__table__.create(sync_engine)
+    now = datetime.now(timezone.utc)
+    rows = [
+        {"central_client_id": uuid.uuid4(), "name": f"client-{i}", "created_at": now, "updated_at": now}
+        for i in range(count)
+    ]
+    with sync_engine.begin() as conn:
+        conn.execute(CentralClients.__table__.insert(), rows)
+    return sorted(str(row["central_client_id"]) for row in rows)
+
+
+def test_list_central_clients_returns_cursor_for_next_page(sqlite_db, make_client):
+    sync_engine, _ = sqlite_db
+    client_ids = seed_central_clients(sync_engine, 5)
+    client = make_client(router)
+
+    first = client.get("/central-clients", params={"limit": 3})
+    assert first.status_code == 200
+    first_body = first.json()
+    assert [row["central_client_id"] for row in first_body["data"]] == client_ids[:3]
+    next_cursor = first_body["meta"]["next_cursor"]
+    assert next_cursor == client_ids[2]
+
+    second = client.get("/central-clients", params={"limit": 3, "after": next_cursor})
+    assert second.status_code == 200
+    second_body = second.json()
+    assert [row["central_client_id"] for row in second_body["data"]] == client_ids[3:]
+    assert second_body["meta"]["next_cursor"] is None
@@ -0,0 +1,60 @@
+import asyncio
+
+from client_service.utils.response_cache import ResponseCache
+
+
+def test_follower_takes_over_when_leader_is_cancelled():
+    async def scenario():
+        cache = ResponseCache(ttl=30, max_entries=16)
+        leader_started = asyncio.Event()
+        calls = []
+
+        async def slow_loader():
+            calls.append("leader")
+            leader_started.set()
+            await asyncio.sleep(10)
+            return "stale"
+
+        async def fast_loader():
+            calls.append("follower")
+            return "fresh"
+
+        leader = asyncio.create_task(cache.get_or_load("role", 1, slow_loader))
+        await leader_started.wait()
+        follower = asyncio.create_task(cache.get_or_load("role", 1, fast_loader))
+        # Let the follower start waiting on the leader's in-flight load
+        await asyncio.sleep(0)
+
+        leader.cancel()
+
+        assert await follower == "fresh"
+        assert leader.cancelled()
+        assert calls == ["leader", "follower"]
+        # The follower's result is cached for later requests
+        assert await cache.get_or_load("role", 1, slow_loader) == "fresh"
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_follower_does_not_cancel_leader():
+    async def scenario():
+        cache = ResponseCache(ttl=30, max_entries=16)
+        release = asyncio.Event()
+
+        async def loader():
+            await release.wait()
+            return "value"
+
+        leader = asyncio.create_task(cache.get_or_load("role", 1, loader))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(cache.get_or_load("role", 1, loader))
+        await asyncio.sleep(0)
+
+        follower.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await leader == "value"
+        assert follower.cancelled()
+
+    asyncio.run(scenario())
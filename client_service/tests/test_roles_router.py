@@ -0,0 +1,98 @@
+import uuid
+from datetime import datetime, timezone
+
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from client_service.api.dependencies import get_read_session
+from client_service.api.routes.roles_router import router
+from client_service.api.routes.users_router import router as users_router
+from client_service.schemas.client_db.user_models import Roles, Users
+
+
+def seed_roles(sync_engine, count, role_ids=None, suffix=""):
+    Roles.__table__.create(sync_engine)
+    now = datetime.now(timezone.utc)
+    role_ids = role_ids or [uuid.uuid4() for _ in range(count)]
+    rows = [
+        {"role_id": role_id, "role_name": f"role-{i}{suffix}", "created_at": now, "updated_at": now}
+        for i, role_id in enumerate(role_ids)
+    ]
+    with sync_engine.begin() as conn:
+        conn.execute(Roles.__table__.insert(), rows)
+    return sorted(str(row["role_id"]) for row in rows)
+
+
+def seed_user(sync_engine, user_id, user_name):
+    Users.__table__.create(sync_engine)
+    now = datetime.now(timezone.utc)
+    with sync_engine.begin() as conn:
+        conn.execute(
+            Users.__table__.insert(),
+            {
+                "user_id": user_id,
+                "client_id": uuid.uuid4(),
+                "user_name": user_name,
+                "email": "user@example.com",
+                "password_hash": "hash",
+                "created_at": now,
+                "updated_at": now,
+            },
+        )
+
+
+def test_list_roles_returns_cursor_for_next_page(sqlite_db, make_client):
+    sync_engine, _ = sqlite_db
+    role_ids = seed_roles(sync_engine, 3)
+    client = make_client(router)
+
+    first = client.get("/roles", params={"limit": 2})
+    assert first.status_code == 200
+    first_body = first.json()
+    assert [role["role_id"] for role in first_body["data"]] == role_ids[:2]
+    next_cursor = first_body["meta"]["next_cursor"]
+    assert next_cursor == role_ids[1]
+
+    second = client.get("/roles", params={"limit": 2, "after": next_cursor})
+    assert second.status_code == 200
+    second_body = second.json()
+    assert [role["role_id"] for role in second_body["data"]] == role_ids[2:]
+    assert second_body["meta"]["next_cursor"] is None
+
+
+def test_cached_get_by_id_cache_miss_reads_primary_not_lagging_replica(sqlite_db, make_client, tmp_path):
+    sync_engine, _ = sqlite_db
+    role_id = uuid.uuid4()
+    user_id = uuid.uuid4()
+    # The primary already has the renamed rows, the replica still holds the pre-write rows
+    seed_roles(sync_engine, 1, role_ids=[role_id], suffix="-renamed")
+    seed_user(sync_engine, user_id, "user-renamed")
+    replica_path = tmp_path / "replica.db"
+    replica_sync_engine = create_engine(f"sqlite:///{replica_path}")
+    seed_roles(replica_sync_engine, 1, role_ids=[role_id])
+    seed_user(replica_sync_engine, user_id, "user")
+    replica_sync_engine.dispose()
+
+    replica_session_maker = async_sessionmaker(
+        create_async_engine(f"sqlite+aiosqlite:///{replica_path}", poolclass=NullPool),
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
+
+    async def replica_session():
+        async with replica_session_maker() as session:
+            yield session
+
+    client = make_client(router, users_router)
+    client.app.dependency_overrides[get_read_session] = replica_session
+
+    # First request loads on a cache miss, the second is served from the cache
+    for _ in range(2):
+        response = client.get(f"/roles/{role_id}")
+        assert response.status_code == 200
+        assert response.json()["data"]["role_name"] == "role-0-renamed"
+
+        response = client.get(f"/users/{user_id}")
+        assert response.status_code == 200
+        assert response.json()["data"]["user_name"] == "user-renamed"
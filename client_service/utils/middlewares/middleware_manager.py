@@ -7,6 +7,7 @@ from fastapi import FastAPI
 # Import all middleware classes and setup functions
 # from .auth_middleware import AuthMiddleware  # Temporarily commented out
 from .cors_middleware import add_cors_middleware
+from .compression_middleware import add_compression_middleware
 from .transaction_middleware import TransactionLogMiddleware
 
 
@@ -23,5 +24,8 @@ def setup_middlewares(app: FastAPI) -> None:
     # app.add_middleware(AuthMiddleware)  # Temporarily commented out
     app.add_middleware(TransactionLogMiddleware)
 
+    # Compress large JSON responses (e.g. document and client listings)
+    add_compression_middleware(app)
+
 
 __all__ = ["setup_middlewares"]
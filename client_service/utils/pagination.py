@@ -0,0 +1,35 @@
+"""
+Pagination helpers shared by the list endpoints
+"""
+import logging
+from typing import Any, Dict, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import Select
+
+logger = logging.getLogger(__name__)
+
+# Offsets beyond this make the database scan and discard many rows per page
+DEEP_OFFSET_THRESHOLD = 10000
+
+
+def paginate(query: Select, key_column, skip: int, limit: int, after: Optional[UUID] = None) -> Select:
+    """
+    Apply keyset pagination when an `after` cursor is given, otherwise offset pagination.
+    Both modes order by the key column so a cursor from either mode stays valid.
+    """
+    query = query.order_by(key_column)
+    
+    if after is not None:
+        return query.where(key_column > after).limit(limit)
+    
+    if skip > DEEP_OFFSET_THRESHOLD:
+        logger.warning(f"Deep offset pagination (skip={skip}) is deprecated, use the 'after' cursor instead")
+    
+    return query.offset(skip).limit(limit)
+
+
+def cursor_meta(rows: Sequence[Any], key_attr: str, limit: int) -> Dict[str, Any]:
+    """Build pagination meta holding the cursor for the next page, if there is one"""
+    next_cursor = getattr(rows[-1], key_attr) if rows and len(rows) == limit else None
+    return {"next_cursor": next_cursor}
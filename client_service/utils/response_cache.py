@@ -0,0 +1,97 @@
+"""
+In-process TTL cache for hot GET-by-id responses
+"""
+import asyncio
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+# Short TTL bounds staleness for writes made through other worker processes
+RESPONSE_CACHE_TTL = float(os.getenv("RESPONSE_CACHE_TTL", 30))
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", 1024))
+
+
+class ResponseCache:
+    """
+    LRU cache of service responses keyed by (namespace, id).
+    Entries expire after `ttl` seconds and are dropped explicitly on update/delete.
+    Concurrent misses for the same key share a single in-flight load.
+    """
+
+    def __init__(self, ttl: float, max_entries: int):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, Hashable], Tuple[float, Any]]" = OrderedDict()
+        self._inflight: Dict[Tuple[str, Hashable], asyncio.Future] = {}
+
+    async def get_or_load(self, namespace: str, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the cached response, or await `loader` and cache its result"""
+        cache_key = (namespace, key)
+        entry = self._entries.get(cache_key)
+
+        if entry is not None and entry[0] > time.monotonic():
+            self._entries.move_to_end(cache_key)
+            return entry[1]
+
+        # Another request is already loading this key, wait for its result
+        inflight = self._inflight.get(cache_key)
+        if inflight is not None:
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                # Re-raise our own cancellation; if only the leader was cancelled, retry the load
+                if not inflight.cancelled() or asyncio.current_task().cancelling():
+                    raise
+                return await self.get_or_load(namespace, key, loader)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[cache_key] = future
+
+        try:
+            value = await loader()
+        except asyncio.CancelledError:
+            # Cancel the shared future so followers take over instead of inheriting the cancellation
+            if self._inflight.get(cache_key) is future:
+                del self._inflight[cache_key]
+            future.cancel()
+            raise
+        except BaseException as e:
+            if self._inflight.get(cache_key) is future:
+                del self._inflight[cache_key]
+            future.set_exception(e)
+            # Mark retrieved so an unawaited failure is not logged by asyncio
+            future.exception()
+            raise
+
+        # Only cache the value if no write invalidated the key while loading
+        if self._inflight.get(cache_key) is future:
+            del self._inflight[cache_key]
+            self._entries[cache_key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(cache_key)
+
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+        future.set_result(value)
+        return value
+
+    def invalidate(self, namespace: str, key: Hashable) -> None:
+        """Drop a cached response after the underlying record changed"""
+        self._entries.pop((namespace, key), None)
+        self._inflight.pop((namespace, key), None)
+
+    def invalidate_namespace(self, namespace: str) -> None:
+        """Drop every cached response in a namespace, e.g. all pages of a list"""
+        for cache_key in [k for k in self._entries if k[0] == namespace]:
+            del self._entries[cache_key]
+        for cache_key in [k for k in self._inflight if k[0] == namespace]:
+            del self._inflight[cache_key]
+
+    def clear(self) -> None:
+        """Drop all cached responses"""
+        self._entries.clear()
+        self._inflight.clear()
+
+
+response_cache = ResponseCache(RESPONSE_CACHE_TTL, RESPONSE_CACHE_MAX_ENTRIES)